@@ -0,0 +1,114 @@
+import os, time, random
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from pygame.math import Vector2
+from pygame.surface import Surface
+
+from kit.graphics import Camera
+from kit.graphics.camera import ScaledSurfacesCache
+
+SCREEN_SIZE = 1504, 768
+CHUNK_SURFACE_SIZE = 512
+VIEW_SIZE = 6, 4
+SPRITES = 16
+FRAMES = 100
+ZOOMS = 0.5, 1.5, 2.5
+ZOOM_WALK_FRAMES = 400
+
+
+def create_surfaces() -> list[tuple[Surface, Vector2]]:
+    surfaces = []
+
+    for x in range(VIEW_SIZE[0]):
+        for y in range(VIEW_SIZE[1]):
+            surface = Surface((CHUNK_SURFACE_SIZE, CHUNK_SURFACE_SIZE), pg.SRCALPHA)
+            surface.fill(((x * 40) % 256, (y * 60) % 256, 128, 255))
+            surfaces.append((
+                surface, Vector2(x - VIEW_SIZE[0] // 2, y - VIEW_SIZE[1] // 2) * CHUNK_SURFACE_SIZE
+            ))
+
+    for sprite_id in range(SPRITES):
+        surface = Surface((32, 32), pg.SRCALPHA)
+        surface.fill((255, sprite_id * 16, 0, 255))
+        surfaces.append((surface, Vector2(sprite_id * 40 - 320, 0)))
+
+    return surfaces
+
+
+def measure(zoom: float, cache: ScaledSurfacesCache, edits: bool) -> float:
+    Camera.scaled_surfaces = cache
+
+    scene = SimpleNamespace(game=SimpleNamespace(screen=Surface(SCREEN_SIZE), delta=0))
+    camera = Camera(scene, zoom, Vector2())
+    surfaces = create_surfaces()
+    start = time.perf_counter()
+
+    for frame in range(FRAMES):
+        cache.reset_frame_area()
+
+        if edits:
+            Camera.invalidate(surfaces[frame % (VIEW_SIZE[0] * VIEW_SIZE[1])][0])
+
+        for surface, position in surfaces:
+            camera.blit(surface, position)
+
+    return (time.perf_counter() - start) / FRAMES
+
+
+def measure_zoom_walk() -> tuple[float, float, int]:
+    cache = ScaledSurfacesCache()
+    Camera.scaled_surfaces = cache
+
+    scene = SimpleNamespace(game=SimpleNamespace(screen=Surface(SCREEN_SIZE), delta=0))
+    camera = Camera(scene, 1, Vector2())
+    surfaces = create_surfaces()
+    rng = random.Random(0)
+    frame_times = []
+    steps = set()
+
+    for _ in range(ZOOM_WALK_FRAMES):
+        if rng.random() < 0.5:
+            camera.zoom_in()
+        else:
+            camera.zoom_out()
+
+        steps.add(camera.zoom_step)
+        start = time.perf_counter()
+
+        cache.reset_frame_area()
+
+        for surface, position in surfaces:
+            camera.blit(surface, position)
+
+        frame_times.append(time.perf_counter() - start)
+
+    frame_times.sort()
+
+    return (
+        sum(frame_times) / len(frame_times), 
+        frame_times[int(len(frame_times) * 0.99)], 
+        len(steps)
+    )
+
+
+def run() -> None:
+    pg.display.set_mode((1, 1))
+
+    print(f"{'zoom':<8}{'cached ms':>11}{'edited ms':>11}")
+
+    for zoom in ZOOMS:
+        cached = measure(zoom, ScaledSurfacesCache(), False)
+        edited = measure(zoom, ScaledSurfacesCache(), True)
+
+        print(f"{zoom:<8}{cached * 1000:>11.3f}{edited * 1000:>11.3f}")
+
+    mean, p99, steps = measure_zoom_walk()
+
+    print(f"zoom walk: {mean * 1000:.3f} ms mean, {p99 * 1000:.3f} ms p99, {steps} zoom steps")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,116 @@
+import time
+from typing import Optional
+from threading import Thread
+from multiprocessing import Event, Process
+
+from network.models import ChunkNetModel
+from network.methods import LoadChunk, LoadChunks
+from network.connection import Connection
+from network.client import ClientDispatcher
+from network.server import BaseServer, ServerDispatcher
+
+from client import Client
+from world import WorldData, WorldGenerationManager
+
+ADDRESS = "127.0.0.1", 8089
+POSITIONS = [ (x, y) for x in range(8) for y in range(6) ]
+REPEATS = 20
+
+
+def serve(ready: Event) -> None:
+    server = BaseServer(ADDRESS)
+    dp = ServerDispatcher(server)
+    world = WorldData()
+
+    WorldGenerationManager(world).generate_chunks((8, 6))
+
+    def get_chunk_net_model(position: tuple[int, int], revision: Optional[int] = None) -> ChunkNetModel:
+        chunk = world.chunks[position]
+
+        if revision == chunk.revision:
+            return ChunkNetModel(
+                blocks=None,
+                position=position,
+                revision=chunk.revision,
+                structures=None
+            )
+
+        return ChunkNetModel(
+            blocks=chunk.blocks.data,
+            position=position,
+            revision=chunk.revision,
+            structures=chunk.structures.data
+        )
+
+    @dp.on(LoadChunk)
+    def on_load_chunk(method: LoadChunk, connection: Connection) -> ChunkNetModel:
+        return get_chunk_net_model(method.position, method.revision)
+
+    @dp.on(LoadChunks)
+    def on_load_chunks(method: LoadChunks, connection: Connection) -> list[ChunkNetModel]:
+        return [ get_chunk_net_model(position) for position in method.positions ]
+
+    ready.set()
+    dp.run()
+
+
+def load_threads(client: Client) -> None:
+    threads = [ Thread(target=client.load_chunk, args=(position, )) for position in POSITIONS ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+
+def load_futures(client: Client) -> None:
+    callbacks = [ client(LoadChunk(position=position), _async=True) for position in POSITIONS ]
+
+    for callback in callbacks:
+        callback.wait_result()
+
+
+def load_unchanged(client: Client) -> None:
+    callbacks = [
+        client(LoadChunk(position=position, revision=0), _async=True) for position in POSITIONS
+    ]
+
+    for callback in callbacks:
+        callback.wait_result()
+
+
+def load_batch(client: Client) -> None:
+    client(LoadChunks(positions=POSITIONS), _async=True).wait_result()
+
+
+def run() -> None:
+    ready = Event()
+    process = Process(target=serve, args=(ready, ), daemon=True)
+    process.start()
+    ready.wait()
+
+    client = Client(address=ADDRESS)
+    Thread(target=ClientDispatcher(client).run, daemon=True).start()
+
+    print(f"{'path':<24}{f'{len(POSITIONS)} chunks ms':>16}")
+
+    for name, load in (
+        ("thread per LoadChunk", load_threads),
+        ("pipelined futures", load_futures),
+        ("unchanged revisions", load_unchanged),
+        ("LoadChunks batch", load_batch)
+    ):
+        start = time.perf_counter()
+
+        for _ in range(REPEATS):
+            load(client)
+
+        print(f"{name:<24}{(time.perf_counter() - start) / REPEATS * 1000:>16.1f}")
+
+    process.terminate()
+    process.join()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,88 @@
+import os, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from world import WorldController, WorldGenerationManager, ChunkRenderer, CHUNK_RENDERS_PER_FRAME
+
+SEED = 1
+WALK_SIZE = 16
+WORLD_SIZE = WALK_SIZE + 6, 4
+FRAMES_PER_STEP = 8
+BUDGETS = None, CHUNK_RENDERS_PER_FRAME
+
+
+class NullNetManager:
+    def subscribe_view(self, position: tuple[int, int], size: tuple[int, int]) -> None:
+        pass
+
+
+class CountingChunkRenderer(ChunkRenderer):
+    renders: int = 0
+
+    def render(self, *args, **kwargs) -> pg.Surface:
+        self.renders += 1
+
+        return super().render(*args, **kwargs)
+
+
+def walk(
+    world: WorldController, 
+    positions: list[tuple[int, int]], 
+    max_renders: int
+) -> tuple[float, float, int]:
+    view = world.view
+    renders = view.renderer.renders
+    durations = []
+
+    for position in positions:
+        view.offset(position)
+
+        for _ in range(FRAMES_PER_STEP):
+            start = time.perf_counter()
+            view.update(max_renders)
+            durations.append(time.perf_counter() - start)
+
+    return sum(durations) / len(durations), max(durations), view.renderer.renders - renders
+
+
+def create_world(resources_manager) -> WorldController:
+    world = WorldController(NullNetManager(), resources_manager)
+    world.view.renderer = CountingChunkRenderer(resources_manager, world.view.tile_size)
+
+    WorldGenerationManager(world, SEED).generate_chunks(WORLD_SIZE)
+    world.view.update(None)
+
+    return world
+
+
+def run() -> None:
+    pg.display.set_mode((1, 1))
+
+    from resources import ResourcesManager
+
+    resources_manager = ResourcesManager()
+    forward = [ (x, 0) for x in range(1, WALK_SIZE + 1) ]
+    backward = [ (x, 0) for x in range(WALK_SIZE - 1, -1, -1) ]
+
+    print(f"{'budget':<8}{'walk':<10}{'mean frame ms':>15}{'max frame ms':>14}{'renders':>10}")
+
+    for max_renders in BUDGETS:
+        world = create_world(resources_manager)
+
+        for name, positions in (
+            ("forward", forward),
+            ("back", backward),
+            ("forward", forward)
+        ):
+            mean_duration, max_duration, renders = walk(world, positions, max_renders)
+
+            print(
+                f"{str(max_renders):<8}{name:<10}{mean_duration * 1000:>15.3f}"
+                f"{max_duration * 1000:>14.3f}{renders:>10}"
+            )
+
+
+if __name__ == "__main__":
+    run()
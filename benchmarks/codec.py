@@ -0,0 +1,112 @@
+import json, random
+from timeit import timeit
+
+from pydantic import TypeAdapter
+
+from network.codec import BinaryCodec
+from network.models import ChunkNetModel, PlayerNetModel, InventoryNetModel
+from network.methods import LoadChunk, GetPlayers, MovePlayer
+from network.updates import Update, Callback, PlayerMove, UpdatesFactory
+
+from world import WorldData, WorldGenerationManager
+
+NUMBER = 2000
+
+
+def legacy_encode(update: Update) -> bytes:
+    return json.dumps({
+        "type": update.update_type,
+        "data": update.model_dump()
+    }).encode() + b"\n"
+
+
+def legacy_decode(data: bytes, updates_factory: UpdatesFactory) -> Update:
+    return updates_factory.from_dict(json.loads(data))
+
+
+def validate(update: Update, adapters: dict[int, TypeAdapter]) -> None:
+    if isinstance(update, Callback):
+        adapters[update.method_type].validate_python(update.result)
+
+
+def make_updates() -> dict[str, Update]:
+    chunk = ChunkNetModel(
+        blocks=[ [ random.randint(0, 1) for _ in range(16) ] for _ in range(16) ],
+        position=(3, 4),
+        revision=0,
+        structures=[ [ random.randint(0, 9) for _ in range(16) ] for _ in range(16) ]
+    )
+    world = WorldData()
+    WorldGenerationManager(world).generate_chunks((4, 4))
+    world_chunk = world.chunks[2, 2]
+    generated_chunk = ChunkNetModel(
+        blocks=world_chunk.blocks.data,
+        position=world_chunk.position,
+        revision=world_chunk.revision,
+        structures=world_chunk.structures.data
+    )
+    players = [
+        PlayerNetModel(
+            position=(random.randint(0, 400), random.randint(0, 400)),
+            entity_id=i,
+            player_id=i,
+            inventory=InventoryNetModel(
+                data=[(999, 0), (999, 1)] + [(0, None)] * 8,
+                selected_slot_id=1
+            )
+        )
+        for i in range(16)
+    ]
+
+    return {
+        "LoadChunk": Callback(result=chunk, callback_id=1, method_type=LoadChunk.method_type),
+        "WorldChunk": Callback(
+            result=generated_chunk, callback_id=1, method_type=LoadChunk.method_type
+        ),
+        "GetPlayers": Callback(result=players, callback_id=2, method_type=GetPlayers.method_type),
+        "PlayerMove": PlayerMove(position=(120, 340), player_id=7)
+    }
+
+
+def run() -> None:
+    updates_factory = UpdatesFactory()
+    binary_codec = BinaryCodec()
+    adapters = {
+        method.method_type: TypeAdapter(method.return_type) 
+        for method in (LoadChunk, GetPlayers)
+    }
+
+    print(f"{'message':<12}{'path':<8}{'bytes':>8}{'encode us':>12}{'decode us':>12}")
+
+    for name, update in make_updates().items():
+        legacy_data = legacy_encode(update)
+        binary_data = binary_codec.encode_update(update)
+
+        results = [
+            (
+                "json", len(legacy_data),
+                timeit(lambda: legacy_encode(update), number=NUMBER),
+                timeit(
+                    lambda: validate(legacy_decode(legacy_data[:-1], updates_factory), adapters), 
+                    number=NUMBER
+                )
+            ),
+            (
+                "binary", len(binary_data),
+                timeit(lambda: binary_codec.encode_update(update), number=NUMBER),
+                timeit(
+                    lambda: validate(binary_codec.decode_update(binary_data[4:]), adapters), 
+                    number=NUMBER
+                )
+            )
+        ]
+
+        for path, size, encode_time, decode_time in results:
+            print(
+                f"{name:<12}{path:<8}{size:>8}"
+                f"{encode_time / NUMBER * 1e6:>12.1f}{decode_time / NUMBER * 1e6:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
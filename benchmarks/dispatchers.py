@@ -0,0 +1,115 @@
+import time, socket
+from multiprocessing import Event, Process
+
+from network.codec import FRAME_HEADER, BinaryCodec
+from network.methods import GetPlayers, MovePlayer
+from network.updates import PlayerMove
+from network.connection import Connection
+from network.server import BaseServer, ServerDispatcher, AsyncServerDispatcher
+
+ADDRESS = "127.0.0.1", 8089
+CONNECTIONS = 500
+LISTENERS = 100
+BROADCASTS = 20
+
+
+def serve(mode: str, ready: Event) -> None:
+    server = BaseServer(ADDRESS)
+
+    if mode == "asyncio":
+        dp = AsyncServerDispatcher(server)
+    else:
+        dp = ServerDispatcher(server)
+
+    @dp.on(GetPlayers)
+    def on_get_players(method: GetPlayers, connection: Connection) -> list:
+        return []
+
+    @dp.on(MovePlayer)
+    def on_move_player(method: MovePlayer, connection: Connection) -> None:
+        server.broadcast(
+            PlayerMove(position=method.position, player_id=method.player_id), dp.connections
+        )
+
+    ready.set()
+    dp.run()
+
+
+def connect(codec: BinaryCodec) -> socket.socket:
+    sock = socket.create_connection(ADDRESS)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.sendall(bytes([codec.codec_type]))
+
+    return sock
+
+
+def read_frame(sock: socket.socket) -> bytes:
+    data = b""
+
+    while len(data) < FRAME_HEADER.size:
+        data += sock.recv(FRAME_HEADER.size - len(data))
+
+    size, = FRAME_HEADER.unpack(data)
+    data = b""
+
+    while len(data) < size:
+        data += sock.recv(size - len(data))
+
+    return data
+
+
+def measure_connections(codec: BinaryCodec) -> float:
+    start = time.perf_counter()
+
+    for i in range(CONNECTIONS):
+        sock = connect(codec)
+        sock.sendall(codec.encode_method(GetPlayers(), i))
+        read_frame(sock)
+        sock.close()
+
+    return CONNECTIONS / (time.perf_counter() - start)
+
+
+def measure_broadcast(codec: BinaryCodec) -> float:
+    socks = [ connect(codec) for _ in range(LISTENERS) ]
+
+    time.sleep(0.5)
+
+    start = time.perf_counter()
+
+    for i in range(BROADCASTS):
+        socks[0].sendall(codec.encode_method(MovePlayer(position=(i, i), player_id=0), i))
+
+        for sock in socks:
+            read_frame(sock)
+
+    latency = (time.perf_counter() - start) / BROADCASTS
+
+    for sock in socks:
+        sock.close()
+
+    return latency
+
+
+def run() -> None:
+    codec = BinaryCodec()
+
+    print(f"{'dispatcher':<12}{'conn/s':>10}{f'broadcast to {LISTENERS} ms':>24}")
+
+    for mode in ("threaded", "asyncio"):
+        ready = Event()
+        process = Process(target=serve, args=(mode, ready), daemon=True)
+        process.start()
+        ready.wait()
+
+        connections_rate = measure_connections(codec)
+        broadcast_latency = measure_broadcast(codec)
+
+        process.terminate()
+        process.join()
+
+        print(f"{mode:<12}{connections_rate:>10.0f}{broadcast_latency * 1000:>24.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,121 @@
+import time
+from copy import deepcopy
+
+from world import (
+    Position, 
+    WorldData, 
+    WorldGenerationManager, 
+    CHUNK_SIZE, 
+    SMOOTHING_PASSES, 
+    GENERATION_MARGIN,
+    HASH_MASK,
+    HASH_X,
+    HASH_Y,
+    HASH_SEED,
+    HASH_STREAM,
+    DIRECTIONS8
+)
+
+SEED = 1
+SIZES = (20, 10), (100, 100), (500, 500)
+REFERENCE_SIZE = 20, 10
+
+
+def reference_hash(seed: int, x: int, y: int, stream: int) -> int:
+    value = (seed * HASH_SEED + stream * HASH_STREAM + x * HASH_X + y * HASH_Y) & HASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+
+    return value ^ (value >> 31)
+
+
+def reference_count_neighbours(blocks: list[list[int]], position: tuple[int, int]) -> int:
+    x, y = position
+    count = 0
+
+    for dx, dy in DIRECTIONS8:
+        nx, ny = x + dx, y + dy
+
+        if nx < 0 or ny < 0 or nx >= len(blocks[0]) or ny >= len(blocks):
+            continue
+
+        count += blocks[ny][nx]
+
+    return count
+
+
+def reference_generate_chunk(
+    generation_manager: WorldGenerationManager, 
+    position: Position
+) -> tuple[list[list[int]], list[list[int]]]:
+    seed = generation_manager.seed
+    x0 = position[0] * CHUNK_SIZE - GENERATION_MARGIN
+    y0 = position[1] * CHUNK_SIZE - GENERATION_MARGIN
+    size = CHUNK_SIZE + 2 * GENERATION_MARGIN
+
+    blocks = [
+        [ int(reference_hash(seed, x0 + x, y0 + y, 0) < 1 << 63) for x in range(size) ]
+        for y in range(size)
+    ]
+
+    for _ in range(SMOOTHING_PASSES):
+        new_blocks = deepcopy(blocks)
+
+        for y in range(len(blocks)):
+            for x in range(len(blocks[0])):
+                count = reference_count_neighbours(blocks, (x, y))
+
+                if blocks[y][x]:
+                    new_blocks[y][x] = int(count >= 4)
+                else:
+                    new_blocks[y][x] = int(count >= 5)
+
+        blocks = new_blocks
+
+    blocks = [
+        row[GENERATION_MARGIN:GENERATION_MARGIN + CHUNK_SIZE]
+        for row in blocks[GENERATION_MARGIN:GENERATION_MARGIN + CHUNK_SIZE]
+    ]
+    structures = [ [0] * CHUNK_SIZE for _ in range(CHUNK_SIZE) ]
+
+    for y, row in enumerate(blocks):
+        for x, block in enumerate(row):
+            wx, wy = position[0] * CHUNK_SIZE + x, position[1] * CHUNK_SIZE + y
+
+            if block and reference_hash(seed, wx, wy, 1) < 1 << 62:
+                structures[y][x] = reference_hash(seed, wx, wy, 2) % 9 + 1
+
+    return blocks, structures
+
+
+def run() -> None:
+    generation_manager = WorldGenerationManager(WorldData(), SEED)
+
+    start = time.perf_counter()
+    reference = [
+        [ reference_generate_chunk(generation_manager, (x, y)) for x in range(REFERENCE_SIZE[0]) ]
+        for y in range(REFERENCE_SIZE[1])
+    ]
+    reference_time = time.perf_counter() - start
+
+    blocks, structures = generation_manager.generate_region((0, 0), REFERENCE_SIZE)
+    matches = all(
+        blocks[y * CHUNK_SIZE:(y + 1) * CHUNK_SIZE, x * CHUNK_SIZE:(x + 1) * CHUNK_SIZE].tolist() == chunk[0]
+        and structures[y * CHUNK_SIZE:(y + 1) * CHUNK_SIZE, x * CHUNK_SIZE:(x + 1) * CHUNK_SIZE].tolist() == chunk[1]
+        for y, row in enumerate(reference)
+        for x, chunk in enumerate(row)
+    )
+
+    print(f"reference {REFERENCE_SIZE[0]}x{REFERENCE_SIZE[1]}: {reference_time:.2f} s, matches: {matches}")
+    print(f"{'chunks':<12}{'cells':>12}{'numpy s':>10}")
+
+    for size in SIZES:
+        start = time.perf_counter()
+        generation_manager.generate_region((0, 0), size)
+        elapsed = time.perf_counter() - start
+
+        print(f"{f'{size[0]}x{size[1]}':<12}{size[0] * size[1] * CHUNK_SIZE ** 2:>12}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,62 @@
+import os, time, tempfile
+
+import numpy as np
+
+from world import WorldGenerationManager, CHUNK_SIZE
+from region import RegionStorage, REGION_SIZE
+
+SEED = 1
+POSITION = -128, -128
+SIZE = 256, 256
+CHECKED_CHUNKS = (-128, -128), (-97, -1), (0, 0), (31, 32), (127, 127)
+
+
+def measure(processes: int) -> tuple[float, int, int, bool]:
+    with tempfile.TemporaryDirectory() as directory:
+        storage = RegionStorage(directory)
+
+        start = time.perf_counter()
+        generated = storage.pregenerate(SEED, POSITION, SIZE, processes)
+        elapsed = time.perf_counter() - start
+
+        regenerated = storage.pregenerate(SEED, POSITION, SIZE, processes)
+
+        generation_manager = WorldGenerationManager(None, SEED)
+        matches = True
+
+        for position in CHECKED_CHUNKS:
+            chunk = storage.load_chunk(position)
+            blocks, structures = generation_manager.generate_region(position, (1, 1))
+
+            matches &= (
+                np.array_equal(chunk.blocks.data, blocks) and
+                np.array_equal(chunk.structures.data, structures)
+            )
+
+        return elapsed, generated, regenerated, matches
+
+
+def run() -> None:
+    cores = len(os.sched_getaffinity(0))
+    regions = SIZE[0] // REGION_SIZE * SIZE[1] // REGION_SIZE
+
+    print(f"{cores} usable cores, {regions} regions, {SIZE[0] * SIZE[1] * CHUNK_SIZE ** 2} cells")
+
+    start = time.perf_counter()
+    WorldGenerationManager(None, SEED).generate_region(POSITION, SIZE)
+    serial = time.perf_counter() - start
+
+    print(f"{'in-process':<12}{serial:>10.2f}")
+    print(f"{'processes':<12}{'s':>10}{'speedup':>10}{'chunks':>10}{'rerun':>10}{'matches':>10}")
+
+    for processes in sorted({ 1, 2, 4, cores }):
+        elapsed, generated, regenerated, matches = measure(processes)
+
+        print(
+            f"{processes:<12}{elapsed:>10.2f}{serial / elapsed:>10.2f}"
+            f"{generated:>10}{regenerated:>10}{matches!s:>10}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+import time, socket
+from typing import Callable
+from threading import Thread
+
+from network.codec import JsonCodec, BinaryCodec
+from network.buffer import ReceiveBuffer
+from network.updates import Callback
+
+from benchmarks.codec import make_updates
+
+FRAMES = 20000
+
+
+def send_frames(sock: socket.socket, data: bytes) -> None:
+    batch = data * 100
+
+    for _ in range(FRAMES // 100):
+        sock.sendall(batch)
+
+    sock.shutdown(socket.SHUT_WR)
+
+
+def receive_legacy(sock: socket.socket) -> int:
+    frames = 0
+    all_data = b""
+
+    while True:
+        data = sock.recv(1024)
+
+        if not data:
+            return frames
+
+        all_data += data
+
+        while True:
+            if all_data.count(b"\n") == 0:
+                break
+
+            data, _, all_data = all_data.partition(b"\n")
+            frames += 1
+
+
+def receive_buffer(sock: socket.socket) -> int:
+    frames = 0
+    buffer = ReceiveBuffer()
+
+    while True:
+        try:
+            buffer.recv(sock)
+        except ConnectionError:
+            return frames
+
+        for data in buffer.frames():
+            frames += 1
+
+
+def measure(receive: Callable[[socket.socket], int], data: bytes) -> tuple[float, int]:
+    reader, writer = socket.socketpair()
+    thread = Thread(target=send_frames, args=(writer, data))
+
+    start = time.perf_counter()
+    thread.start()
+
+    frames = receive(reader)
+    elapsed = time.perf_counter() - start
+
+    thread.join()
+    reader.close()
+    writer.close()
+
+    return elapsed, frames
+
+
+def run() -> None:
+    callback: Callback = make_updates()["LoadChunk"]
+    json_codec = JsonCodec()
+    binary_codec = BinaryCodec()
+
+    cases = [
+        ("legacy json", receive_legacy, json_codec.encode_update(callback)[4:] + b"\n"),
+        ("buffer json", receive_buffer, json_codec.encode_update(callback)),
+        ("buffer binary", receive_buffer, binary_codec.encode_update(callback))
+    ]
+
+    print(f"LoadChunk responses: {FRAMES}")
+    print(f"{'path':<16}{'frame bytes':>12}{'frames/s':>12}{'MB/s':>10}")
+
+    for name, receive, data in cases:
+        elapsed, frames = measure(receive, data)
+
+        assert frames == FRAMES
+
+        print(
+            f"{name:<16}{len(data):>12}{frames / elapsed:>12.0f}"
+            f"{len(data) * frames / elapsed / 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
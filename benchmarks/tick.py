@@ -0,0 +1,157 @@
+import socket
+from threading import Thread
+
+from network.codec import BinaryCodec
+from network.models import InventoryNetModel
+from network.updates import PlayerSnapshot, InventoryUpdate
+from network.connection import Writer, Connection
+from network.server import TickServer
+
+from snapshots import merge_snapshots
+
+ADDRESS = "127.0.0.1", 8089
+GROUP_SIZE = 16
+TICKS = 100
+STALLED_TICKS = 400
+
+
+def drain(sock: socket.socket) -> None:
+    while sock.recv(1 << 16):
+        ...
+
+
+def measure(server: TickServer, players: int) -> tuple[float, float]:
+    writer = Writer()
+    codec = BinaryCodec()
+    connections = []
+
+    Thread(target=writer.run, daemon=True).start()
+
+    for _ in range(players):
+        server_sock, client_sock = socket.socketpair()
+        connections.append(Connection(server_sock, codec, writer))
+
+        Thread(target=drain, args=(client_sock, ), daemon=True).start()
+
+    def move_group(group: int) -> None:
+        server.broadcast(
+            PlayerSnapshot(
+                move_ids=list(range(group, group + GROUP_SIZE)),
+                moves=[ [1, 0] ] * GROUP_SIZE,
+                position_ids=[],
+                positions=[]
+            ),
+            connections[group:group + GROUP_SIZE]
+        )
+
+    server.durations.clear()
+
+    for _ in range(TICKS):
+        for group in range(0, players, GROUP_SIZE):
+            server.submit(move_group, group)
+
+        server.tick()
+
+    durations = tuple(server.durations)
+
+    for connection in connections:
+        connection.sock.close()
+
+    return sum(durations) / len(durations), max(durations)
+
+
+def measure_stalled(server: TickServer, players: int) -> tuple[float, float, int, int, bool]:
+    writer = Writer()
+    codec = BinaryCodec()
+    connections = []
+
+    Thread(target=writer.run, daemon=True).start()
+
+    for _ in range(players):
+        server_sock, client_sock = socket.socketpair()
+        connections.append(Connection(server_sock, codec, writer))
+
+        Thread(target=drain, args=(client_sock, ), daemon=True).start()
+
+    stalled_sock, stalled_client_sock = socket.socketpair()
+    stalled = Connection(stalled_sock, codec, writer)
+    inventory = InventoryNetModel(data=[(999, 0), (999, 1)] + [(0, None)] * 8, selected_slot_id=1)
+
+    def move_group(group: int) -> None:
+        group_connections = connections[group:group + GROUP_SIZE] + [stalled]
+
+        server.broadcast(
+            PlayerSnapshot(
+                move_ids=list(range(group, group + GROUP_SIZE)),
+                moves=[ [1, 0] ] * GROUP_SIZE,
+                position_ids=[],
+                positions=[]
+            ),
+            group_connections
+        )
+
+        for player_id in range(group, group + GROUP_SIZE):
+            server.broadcast(
+                InventoryUpdate(player_id=player_id, inventory=inventory),
+                group_connections,
+                exclude=connections[player_id]
+            )
+
+    server.durations.clear()
+    server.dropped = 0
+    server.disconnected = 0
+    queue_depth = 0
+
+    for _ in range(STALLED_TICKS):
+        for group in range(0, players, GROUP_SIZE):
+            server.submit(move_group, group)
+
+        server.tick()
+        queue_depth = max(queue_depth, server.queue_depth)
+
+    durations = tuple(server.durations)
+    disconnected = server.disconnected > 0
+
+    server.discard(stalled)
+
+    for connection in connections + [stalled]:
+        connection.sock.close()
+
+    stalled_client_sock.close()
+
+    return (
+        sum(durations) / len(durations), max(durations),
+        queue_depth, server.dropped, disconnected
+    )
+
+
+def run() -> None:
+    server = TickServer(ADDRESS)
+    server.coalesce(PlayerSnapshot)(merge_snapshots)
+
+    print(f"{'players':<10}{'mean tick ms':>14}{'max tick ms':>14}")
+
+    for players in (16, 128, 512):
+        mean_duration, max_duration = measure(server, players)
+
+        print(f"{players:<10}{mean_duration * 1000:>14.2f}{max_duration * 1000:>14.2f}")
+
+    print()
+    print(
+        f"{'players':<10}{'mean tick ms':>14}{'max tick ms':>14}{'queue':>8}"
+        f"{'dropped':>10}{'disconnected':>14}"
+    )
+
+    for players in (16, 128, 512):
+        mean_duration, max_duration, queue_depth, dropped, disconnected = (
+            measure_stalled(server, players)
+        )
+
+        print(
+            f"{players:<10}{mean_duration * 1000:>14.2f}{max_duration * 1000:>14.2f}{queue_depth:>8}"
+            f"{dropped:>10}{str(disconnected):>14}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+import os, time, random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from pygame.surface import Surface
+
+from kit.components.tile_map import TileMapComponent
+
+SIZE = 96, 64
+TEXTURES = 16
+FRAMES = 200
+CHANGES = 0, 16, 256, 2048
+FULL_FRAMES = 20
+
+
+def create_tile_map() -> TileMapComponent:
+    textures = []
+
+    for texture_id in range(TEXTURES):
+        texture = Surface((32, 32), pg.SRCALPHA)
+        texture.fill((texture_id * 16, 255 - texture_id * 16, 128, 255))
+        textures.append(texture)
+
+    tile_map = TileMapComponent(SIZE, textures)
+    tile_map.data.add_layer(0)
+    tile_map.data.add_layer(0)
+    tile_map.data.fill_layer(1, 0)
+    tile_map.renderer.render()
+
+    return tile_map
+
+
+def measure(changes: int) -> tuple[float, float]:
+    tile_map = create_tile_map()
+    rng = random.Random(changes)
+    positions = [
+        [ (rng.randrange(SIZE[0]), rng.randrange(SIZE[1])) for _ in range(changes) ]
+        for _ in range(FRAMES)
+    ]
+    durations = []
+
+    for frame_positions in positions:
+        for position in frame_positions:
+            tile_map.data.set_value(rng.randrange(TEXTURES), 0, 1, position)
+
+        start = time.perf_counter()
+        tile_map.renderer.render()
+        durations.append(time.perf_counter() - start)
+
+    return sum(durations) / len(durations), max(durations)
+
+
+def measure_full() -> tuple[float, float]:
+    tile_map = create_tile_map()
+    positions = [ (x, y) for x in range(SIZE[0]) for y in range(SIZE[1]) ]
+    durations = []
+
+    for _ in range(FULL_FRAMES):
+        tile_map.data.dirty.update(positions)
+
+        start = time.perf_counter()
+        tile_map.renderer.render()
+        durations.append(time.perf_counter() - start)
+
+    return sum(durations) / len(durations), max(durations)
+
+
+def run() -> None:
+    print(f"{'changes':<10}{'mean frame ms':>15}{'max frame ms':>14}")
+
+    for changes in CHANGES:
+        mean_duration, max_duration = measure(changes)
+
+        print(f"{changes:<10}{mean_duration * 1000:>15.3f}{max_duration * 1000:>14.3f}")
+
+    mean_duration, max_duration = measure_full()
+
+    print(f"{'full':<10}{mean_duration * 1000:>15.3f}{max_duration * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,134 @@
+import sys, time, random, tempfile
+from threading import Thread, Event
+
+from world import Position, WorldData, WorldGenerationManager, Chunk, CHUNK_SIZE
+from region import RegionStorage
+from journal import Journal
+
+SEED = 1
+WORLD_SIZE = 24
+MAX_CHUNKS = 64
+OPERATIONS = 4000
+THREADS = 1, 4, 16
+LOADERS = 2
+SAVE_INTERVAL = 0.1
+
+
+def create_world(directory: str) -> WorldData:
+    world = WorldData(RegionStorage(directory), Journal(directory), max_chunks=MAX_CHUNKS)
+    world.generator = WorldGenerationManager(None, SEED).generate_chunk
+
+    return world
+
+
+def mutate(
+    world: WorldData,
+    thread_id: int,
+    threads: int,
+    expected: dict[Position, int],
+    revisions: dict[Position, int]
+) -> None:
+    rng = random.Random(thread_id)
+    columns = WORLD_SIZE * CHUNK_SIZE // threads
+
+    for _ in range(OPERATIONS):
+        position = rng.randrange(columns) * threads + thread_id, rng.randrange(WORLD_SIZE * CHUNK_SIZE)
+        structure_type = rng.randrange(10)
+        chunk_position = Chunk.get_chunk_position(position)
+
+        if world.get_structure_type(position) != structure_type:
+            revisions[chunk_position] = revisions.get(chunk_position, 0) + 1
+
+        world.set_structure_type(position, structure_type)
+        expected[position] = structure_type
+
+
+def load(world: WorldData, thread_id: int, stop: Event) -> None:
+    rng = random.Random(-thread_id)
+
+    while not stop.is_set():
+        world.get_chunk((rng.randrange(WORLD_SIZE), rng.randrange(WORLD_SIZE)))
+
+
+def maintain(world: WorldData, stop: Event) -> None:
+    while not stop.wait(SAVE_INTERVAL):
+        world.save_dirty_chunks()
+        world.evict_chunks()
+
+
+def check(world: WorldData, expected: dict[Position, int], revisions: dict[Position, int]) -> bool:
+    cells = all(
+        world.get_structure_type(position) == structure_type
+        for position, structure_type in expected.items()
+    )
+    chunks = all(
+        world.get_chunk(chunk_position).revision == revision
+        for chunk_position, revision in revisions.items()
+    )
+
+    return cells and chunks
+
+
+def measure(threads: int) -> tuple[float, bool, bool]:
+    with tempfile.TemporaryDirectory() as directory:
+        world = create_world(directory)
+        stop = Event()
+        expected: dict[Position, int] = {}
+        revisions: list[dict[Position, int]] = [ {} for _ in range(threads) ]
+
+        mutators = [
+            Thread(target=mutate, args=(world, thread_id, threads, expected, revisions[thread_id]))
+            for thread_id in range(threads)
+        ]
+        workers = [
+            Thread(target=load, args=(world, thread_id, stop)) for thread_id in range(LOADERS)
+        ] + [ Thread(target=maintain, args=(world, stop)) ]
+
+        start = time.perf_counter()
+
+        for thread in mutators + workers:
+            thread.start()
+
+        for thread in mutators:
+            thread.join()
+
+        elapsed = time.perf_counter() - start
+        stop.set()
+
+        for thread in workers:
+            thread.join()
+
+        total_revisions: dict[Position, int] = {}
+
+        for thread_revisions in revisions:
+            for chunk_position, revision in thread_revisions.items():
+                total_revisions[chunk_position] = total_revisions.get(chunk_position, 0) + revision
+
+        consistent = check(world, expected, total_revisions)
+
+        world.save_dirty_chunks()
+
+        reloaded_world = create_world(directory)
+        reloaded_world.recover()
+        persisted = check(reloaded_world, expected, total_revisions)
+
+    return threads * OPERATIONS / elapsed, consistent, persisted
+
+
+def run() -> None:
+    print(f"{'threads':<10}{'edits/s':>10}{'consistent':>12}{'persisted':>11}")
+
+    failed = False
+
+    for threads in THREADS:
+        rate, consistent, persisted = measure(threads)
+        failed = failed or not (consistent and persisted)
+
+        print(f"{threads:<10}{rate:>10.0f}{str(consistent):>12}{str(persisted):>11}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -15,7 +15,8 @@ from network.methods import (
     DamageStructure,
     DestroyStructure,
     GetPlayers,
-    PlaceStructure
+    PlaceStructure,
+    SubscribeView
 )
 
 
@@ -25,10 +26,11 @@ class Client(BaseClient):
             JoinServer()
         )
   
-    def load_chunk(self, position: tuple[int, int]) -> Optional[ChunkNetModel]:
+    def load_chunk(self, position: tuple[int, int], revision: Optional[int] = None) -> Optional[ChunkNetModel]:
         return self(
             LoadChunk(
-                position=position
+                position=position,
+                revision=revision
             )
         )
     
@@ -82,3 +84,11 @@ class Client(BaseClient):
                 structure_type=structure_type
             )
         )
+
+    def subscribe_view(self, position: tuple[int, int], size: tuple[int, int]) -> None:
+        return self(
+            SubscribeView(
+                position=position,
+                size=size
+            )
+        )
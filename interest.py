@@ -0,0 +1,142 @@
+from typing import Optional
+from threading import Lock
+
+from network.connection import Connection
+
+from world import Chunk, Position
+
+TILE_SIZE = 32
+MAX_VIEW_SIZE = 16, 16
+
+
+class InterestManager:
+    lock: Lock
+    chunks: dict[Connection, set[Position]]
+    subscribers: dict[Position, set[Connection]]
+    players: dict[Position, set[int]]
+    players_chunks: dict[int, Position]
+    revisions: dict[Connection, dict[Position, int]]
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.chunks = {}
+        self.subscribers = {}
+        self.players = {}
+        self.players_chunks = {}
+        self.revisions = {}
+
+    def get_view_chunks(self, position: Position, size: tuple[int, int]) -> set[Position]:
+        width = min(size[0], MAX_VIEW_SIZE[0])
+        height = min(size[1], MAX_VIEW_SIZE[1])
+
+        return {
+            (position[0] + x, position[1] + y)
+            for x in range(width)
+            for y in range(height)
+        }
+
+    def get_player_chunk_position(self, position: Position) -> Position:
+        return Chunk.get_chunk_position((position[0] // TILE_SIZE, position[1] // TILE_SIZE))
+
+    def subscribe(self, 
+        connection: Connection, 
+        position: Position, 
+        size: tuple[int, int]
+    ) -> tuple[list[Position], list[Position]]:
+        chunks = self.get_view_chunks(position, size)
+
+        with self.lock:
+            prev_chunks = self.chunks.get(connection, set())
+            left_chunks = list(prev_chunks - chunks)
+
+            for chunk_position in left_chunks:
+                subscribers = self.subscribers[chunk_position]
+                subscribers.discard(connection)
+
+                if not subscribers:
+                    del self.subscribers[chunk_position]
+
+            entered_chunks = chunks - prev_chunks
+
+            for chunk_position in entered_chunks:
+                self.subscribers.setdefault(chunk_position, set()).add(connection)
+
+            self.chunks[connection] = chunks
+
+        cx = position[0] + (min(size[0], MAX_VIEW_SIZE[0]) - 1) / 2
+        cy = position[1] + (min(size[1], MAX_VIEW_SIZE[1]) - 1) / 2
+
+        return sorted(
+            entered_chunks,
+            key=lambda chunk_position: (chunk_position[0] - cx) ** 2 + (chunk_position[1] - cy) ** 2
+        ), left_chunks
+
+    def unsubscribe(self, connection: Connection) -> None:
+        with self.lock:
+            for chunk_position in self.chunks.pop(connection, ()):
+                subscribers = self.subscribers[chunk_position]
+                subscribers.discard(connection)
+
+                if not subscribers:
+                    del self.subscribers[chunk_position]
+
+            self.revisions.pop(connection, None)
+
+    def get_revision(self, connection: Connection, chunk_position: Position) -> Optional[int]:
+        return self.revisions.get(connection, {}).get(chunk_position)
+
+    def set_revision(self, connection: Connection, chunk_position: Position, revision: int) -> None:
+        self.revisions.setdefault(connection, {})[chunk_position] = revision
+
+    def get_subscribers(self, chunk_position: Position) -> list[Connection]:
+        with self.lock:
+            return list(self.subscribers.get(chunk_position, ()))
+
+    def move_player(self, player_id: int, position: Position) -> None:
+        chunk_position = self.get_player_chunk_position(position)
+
+        with self.lock:
+            prev_chunk_position = self.players_chunks.get(player_id)
+
+            if prev_chunk_position == chunk_position:
+                return
+
+            if prev_chunk_position is not None:
+                players = self.players[prev_chunk_position]
+                players.discard(player_id)
+
+                if not players:
+                    del self.players[prev_chunk_position]
+
+            self.players.setdefault(chunk_position, set()).add(player_id)
+            self.players_chunks[player_id] = chunk_position
+
+    def remove_player(self, player_id: int) -> None:
+        with self.lock:
+            chunk_position = self.players_chunks.pop(player_id, None)
+
+            if chunk_position is None:
+                return
+
+            players = self.players[chunk_position]
+            players.discard(player_id)
+
+            if not players:
+                del self.players[chunk_position]
+
+    def get_players(self, chunk_positions: list[Position]) -> list[int]:
+        with self.lock:
+            return [
+                player_id
+                for chunk_position in chunk_positions
+                for player_id in self.players.get(chunk_position, ())
+            ]
+
+    def get_player_subscribers(self, player_id: int) -> list[Connection]:
+        with self.lock:
+            chunk_position = self.players_chunks.get(player_id)
+
+            if chunk_position is None:
+                return []
+
+            return list(self.subscribers.get(chunk_position, ()))
@@ -0,0 +1,71 @@
+import os, struct
+from typing import Iterator
+
+JOURNAL_RECORD = struct.Struct("<Biii")
+BLOCKS_LAYER = 0
+STRUCTURES_LAYER = 1
+AUTOSAVE_INTERVAL = 5
+
+
+class Journal:
+    fd: int
+    sequence: int
+    directory: str
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+        os.makedirs(directory, exist_ok=True)
+
+        segments = self.get_segments()
+        self.sequence = self.get_sequence(segments[-1]) + 1 if segments else 0
+        self.fd = self.open_segment(self.sequence)
+
+    @staticmethod
+    def get_sequence(path: str) -> int:
+        return int(os.path.basename(path).split(".")[1])
+
+    def get_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f"journal.{sequence}.log")
+
+    def get_segments(self) -> list[str]:
+        return sorted(
+            (
+                os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                if name.startswith("journal.") and name.endswith(".log")
+            ),
+            key=self.get_sequence
+        )
+
+    def open_segment(self, sequence: int) -> int:
+        return os.open(self.get_path(sequence), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def append(self, layer: int, position: tuple[int, int], value: int) -> None:
+        os.write(self.fd, JOURNAL_RECORD.pack(layer, position[0], position[1], value))
+
+    def read(self) -> Iterator[tuple[int, tuple[int, int], int]]:
+        for path in self.get_segments():
+            with open(path, "rb") as file:
+                data = file.read()
+
+            size = len(data) - len(data) % JOURNAL_RECORD.size
+
+            for layer, x, y, value in JOURNAL_RECORD.iter_unpack(data[:size]):
+                yield layer, (x, y), value
+
+    def open_next_segment(self) -> int:
+        return self.open_segment(self.sequence + 1)
+
+    def swap_segment(self, fd: int) -> int:
+        previous_fd = self.fd
+        self.fd = fd
+        self.sequence += 1
+
+        return previous_fd
+
+    def close_segment(self, fd: int) -> None:
+        os.close(fd)
+
+    def remove(self, segments: list[str]) -> None:
+        for path in segments:
+            os.remove(path)
@@ -8,6 +8,7 @@ import pygame as pg
 from pygame.draw import rect as draw_rect
 from pygame.math import Vector2
 from pygame.font import Font, SysFont
+from pygame.rect import Rect
 from pygame.surface import Surface
 
 from kit.graphics import Color, Camera
@@ -20,6 +21,17 @@ def get_font(font_size: int) -> Font:
     return SysFont("Arial", font_size)
 
 
+@cache
+def get_text_surface(value: str, tile_size: int) -> Surface:
+    text = get_font(14).render(value, None, Color(255))
+    height = text.get_size()[1]
+
+    surface = Surface((tile_size, tile_size), pg.SRCALPHA)
+    surface.blit(text, Vector2(3, tile_size - height - 3))
+
+    return surface
+
+
 class TileLayer:
     data: dict[int, object]
     layer_type: int
@@ -44,15 +56,26 @@ class TextTileLayer(TileLayer):
 
 class Tile:
     layers: list[TileLayer]
-    changed: bool
+    position: Position
+    dirty: set[Position]
 
-    def __init__(self, layer_types: Optional[list[int]] = None) -> None:
+    def __init__(
+        self, 
+        layer_types: Optional[list[int]] = None, 
+        position: Position = (0, 0), 
+        dirty: Optional[set[Position]] = None
+    ) -> None:
         self.layers = []
-        self.changed = False
+        self.position = position
+        self.dirty = set() if dirty is None else dirty
 
         for layer_type in [] or layer_types:
             self.add_layer(layer_type)
 
+    @property
+    def changed(self) -> bool:
+        return self.position in self.dirty
+
     def add_layer(self, layer_type: int) -> None:
         if layer_type == 0:
             layer = TextureTileLayer()
@@ -60,14 +83,14 @@ class Tile:
             layer = TextTileLayer()
         
         self.layers.append(layer)
-        self.changed = True
+        self.dirty.add(self.position)
 
     def get_value(self, z_index: int, layer_id: int) -> int:
         return self.layers[layer_id].get_value(z_index)
 
     def set_value(self, value: object, z_index: int, layer_id: int) -> None:     
         self.layers[layer_id].set_value(value, z_index)
-        self.changed = True
+        self.dirty.add(self.position)
 
     def remove_value(self, z_index: int, layer_id: int) -> None:
         layer = self.layers[layer_id]
@@ -76,24 +99,29 @@ class Tile:
             return 
         
         layer.remove_value(z_index)
-        self.changed = True
+        self.dirty.add(self.position)
 
 
 class TileMapData:
     size: tuple[int, int]
+    dirty: set[Position]
     tiles: list[list[Tile]]
     layers: list[int]
     component: TileMapComponent
 
     def __init__(self, size: tuple[int, int], component: TileMapComponent) -> None:
         self.size = size
+        self.dirty = set()
         self.layers = []
 
         self.tiles = self.create_tiles()
         self.component = component
 
     def create_tiles(self) -> list[list[Tile]]:
-        return [[ Tile(self.layers) for _ in range(self.size[0]) ] for _ in range(self.size[1]) ]
+        return [
+            [ Tile(self.layers, (x, y), self.dirty) for x in range(self.size[0]) ] 
+            for y in range(self.size[1])
+        ]
     
     def add_layer(self, layer_type: int) -> None:
         self.layers.append(layer_type)
@@ -138,43 +166,64 @@ class TileMapRenderer:
         return Surface(self.by_tile_size(self.component.size), pg.SRCALPHA)
 
     def render(self) -> None:
-        for y, tiles_row in enumerate(self.component.data.tiles):
-            for x, tile in enumerate(tiles_row):
-                if not tile.changed:
-                    continue
+        data = self.component.data
+        dirty = data.dirty
+        positions = []
+
+        while dirty:
+            positions.append(dirty.pop())
+
+        if not positions:
+            return
+
+        positions.sort(key=lambda position: (position[1], position[0]))
+        rect = None
+        blits = []
 
-                tile.changed = False
+        for run_rect in self.get_runs(positions):
+            self.surface.fill((0, 0, 0, 0), run_rect)
+            rect = run_rect if rect is None else rect.union(run_rect)
 
-                self.render_tile((x, y), tile)
+        for position in positions:
+            blits.extend(self.get_tile_blits(position, data.get_tile(position)))
 
-    def render_tile(self, position: Position, tile: Tile) -> None:
+        self.surface.blits(blits, False)
+
+        Camera.invalidate(self.surface, rect)
+
+    def get_runs(self, positions: list[Position]) -> list[Rect]:
+        runs = []
+        start = end = positions[0]
+
+        for position in positions[1:]:
+            if position[1] == end[1] and position[0] == end[0] + 1:
+                end = position
+
+                continue
+
+            runs.append(Rect(self.by_tile_size(start), self.by_tile_size((end[0] - start[0] + 1, 1))))
+            start = end = position
+
+        runs.append(Rect(self.by_tile_size(start), self.by_tile_size((end[0] - start[0] + 1, 1))))
+
+        return runs
+
+    def get_tile_blits(self, position: Position, tile: Tile) -> list[tuple[Surface, Position]]:
         position = self.by_tile_size(position)
-        
-        draw_rect(
-            self.surface, (0, 0, 0, 0), 
-            (position, self.by_tile_size((1, 1)))
-        )
+        blits = []
 
         for layer in tile.layers:
             data = layer.data
 
             for z_index in sorted(data.keys()):
-                match layer.layer_type:
-                    case 0:
-                        value: int = data[z_index]
-
-                        surface = self.textures[value]
-                    case 1:
-                        font = get_font(14)
-                        value: str = data[z_index]
-
-                        text = font.render(value, None, Color(255))
-                        height = text.get_size()[1]
+                if layer.layer_type == 0:
+                    surface = self.textures[data[z_index]]
+                else:
+                    surface = get_text_surface(data[z_index], self.tile_size)
 
-                        surface = Surface(self.by_tile_size((1, 1)), pg.SRCALPHA)
-                        surface.blit(text, Vector2(3, self.tile_size - height - 3))
+                blits.append((surface, position))
 
-                self.surface.blit(surface, position)
+        return blits
 
     def by_tile_size(self, value: tuple[int, int]) -> tuple[int, int]:
         return value[0] * self.tile_size, value[1] * self.tile_size
@@ -1,4 +1,6 @@
+from math import ceil, floor, log
 from typing import ClassVar, Optional
+from collections import OrderedDict
 
 import pygame as pg
 from pygame.rect import Rect
@@ -6,7 +8,7 @@ from pygame.math import Vector2
 from pygame.surface import Surface
 from pygame.transform import scale_by
 
-from kit.math import clip, min_vector, max_vector, round_vector
+from kit.math import min_vector, max_vector, round_vector
 from kit.input import Mouse, Keyboard
 from kit.scene import Scene
 
@@ -15,15 +17,144 @@ from .color import (
     random_color as random_color
 )
 
+SCALED_SURFACES_BUDGET = 64 << 20
+MAX_SCALED_AREA = 1 << 22
+SCALED_AREA_PER_FRAME = 1 << 21
+MAX_NEIGHBOUR_STEPS = 4
+
+ScaledSurfaceKey = tuple[int, Optional[tuple[int, int, int, int]], int]
+
+
+class ScaledSurface:
+    zoom: float
+    source: Surface
+    surface: Surface
+    subrect: Optional[Rect]
+
+    def __init__(self, source: Surface, surface: Surface, subrect: Optional[Rect], zoom: float) -> None:
+        self.zoom = zoom
+        self.source = source
+        self.surface = surface
+        self.subrect = subrect
+
+
+class ScaledSurfacesCache:
+    size: int
+    max_size: int
+    frame_area: int
+    surfaces: OrderedDict[ScaledSurfaceKey, ScaledSurface]
+
+    def __init__(self, max_size: int = SCALED_SURFACES_BUDGET) -> None:
+        self.size = 0
+        self.max_size = max_size
+        self.frame_area = SCALED_AREA_PER_FRAME
+        self.surfaces = OrderedDict()
+
+    @staticmethod
+    def get_surface_size(surface: Surface) -> int:
+        width, height = surface.get_size()
+
+        return width * height * surface.get_bytesize()
+
+    @staticmethod
+    def get_area(subrect: Optional[Rect], zoom: float) -> Optional[Rect]:
+        if subrect is None:
+            return None
+
+        return Rect(
+            ceil(subrect.x * zoom), ceil(subrect.y * zoom), 
+            int(subrect.w * zoom), int(subrect.h * zoom)
+        )
+
+    def reset_frame_area(self) -> None:
+        self.frame_area = SCALED_AREA_PER_FRAME
+
+    def get_neighbour(self, key: ScaledSurfaceKey) -> Optional[ScaledSurface]:
+        surface_id, subrect, step = key
+
+        for distance in range(1, MAX_NEIGHBOUR_STEPS + 1):
+            for neighbour_step in (step - distance, step + distance):
+                scaled_surface = self.surfaces.get((surface_id, subrect, neighbour_step))
+
+                if scaled_surface is not None:
+                    self.surfaces.move_to_end((surface_id, subrect, neighbour_step))
+
+                    return scaled_surface
+
+        return None
+
+    def get(
+        self, 
+        source: Surface, 
+        subrect: Optional[Rect], 
+        step: int, 
+        zoom: float
+    ) -> tuple[Surface, Optional[Rect]]:
+        width, height = source.get_size()
+        area = None
+
+        if subrect is not None and width * height * zoom * zoom <= MAX_SCALED_AREA:
+            area = subrect
+            subrect = None
+
+        key = id(source), None if subrect is None else tuple(subrect), step
+        scaled_surface = self.surfaces.get(key)
+
+        if scaled_surface is not None:
+            self.surfaces.move_to_end(key)
+
+            return scaled_surface.surface, self.get_area(area, zoom)
+
+        if subrect is not None:
+            width, height = subrect.size
+
+        scaled_area = int(width * zoom) * int(height * zoom)
+
+        if scaled_area > self.frame_area:
+            scaled_surface = self.get_neighbour(key)
+
+            if scaled_surface is not None:
+                return scaled_surface.surface, self.get_area(area, scaled_surface.zoom)
+
+        self.frame_area -= scaled_area
+
+        surface = scale_by(source if subrect is None else source.subsurface(subrect), (zoom, zoom))
+
+        self.surfaces[key] = ScaledSurface(source, surface, subrect, zoom)
+        self.size += self.get_surface_size(surface)
+
+        while self.size > self.max_size and len(self.surfaces) > 1:
+            _, cold_scaled_surface = self.surfaces.popitem(last=False)
+            self.size -= self.get_surface_size(cold_scaled_surface.surface)
+
+        return surface, self.get_area(area, zoom)
+
+    def invalidate(self, source: Surface, rect: Optional[Rect] = None) -> None:
+        for key, scaled_surface in list(self.surfaces.items()):
+            if scaled_surface.source is not source:
+                continue
+
+            if (
+                rect is not None and 
+                scaled_surface.subrect is not None and 
+                not scaled_surface.subrect.colliderect(rect)
+            ):
+                continue
+
+            del self.surfaces[key]
+            self.size -= self.get_surface_size(scaled_surface.surface)
+
 
 class Camera:
     zoom: float
+    zoom_step: int
     scene: Scene
     position: Vector2
 
     min_zoom: ClassVar[float] = 0.25
     max_zoom: ClassVar[float] = 2.5
     zooming_speed: ClassVar[float] = 1.05
+    scaled_surfaces: ClassVar[ScaledSurfacesCache] = ScaledSurfacesCache()
 
     def __init__(
         self, 
@@ -32,18 +163,28 @@ class Camera:
         position: Vector2,
         background_color: Color = Color()
     ) -> None:
-        self.zoom = zoom
         self.scene = scene
         self.position = position
         self.background_color = background_color
 
+        self.set_zoom_step(round(log(zoom) / log(self.zooming_speed)))
+
+    def set_zoom_step(self, step: int) -> None:
+        min_step = ceil(log(self.min_zoom) / log(self.zooming_speed))
+        max_step = floor(log(self.max_zoom) / log(self.zooming_speed))
+
+        self.zoom_step = max(min_step, min(step, max_step))
+        self.zoom = self.zooming_speed ** self.zoom_step
+
     def zoom_in(self) -> None:
-        self.zoom = clip(self.zoom * self.zooming_speed, self.min_zoom, self.max_zoom)
+        self.set_zoom_step(self.zoom_step + 1)
 
     def zoom_out(self) -> None:
-        self.zoom = clip(self.zoom / self.zooming_speed, self.min_zoom, self.max_zoom)
+        self.set_zoom_step(self.zoom_step - 1)
 
     def update(self, movement: bool = True) -> None:
+        self.scaled_surfaces.reset_frame_area()
+
         if movement:
             velocity = 0.40 / self.zoom * self.scene.game.delta
 
@@ -63,6 +204,10 @@ class Camera:
         if wheel < 0:
             self.zoom_out()
 
+    @classmethod
+    def invalidate(cls, surface: Surface, rect: Optional[Rect] = None) -> None:
+        cls.scaled_surfaces.invalidate(surface, rect)
+
     def get_mouse_position(self) -> Vector2:
         mouse_pos = Vector2(Mouse.get_pos())
         mouse_pos -= Vector2(self.scene.game.screen.get_size()) / 2
@@ -104,19 +249,19 @@ class Camera:
             return
 
         if size.x > rect.w and size.y > rect.h:
-            _surface = surface
+            subrect = None
         else:
             subrect = Rect(min_pos - Vector2(rect.topleft), size)
             subrect = subrect.clip(Vector2(), Vector2(rect.size))
 
             if subrect.x < 0 or subrect.y < 0 or subrect.w <= 1 or subrect.h <= 1:
                 return
-            
-            _surface = surface.subsurface(subrect)
 
-        if zoom:
-            screen.blit(
-                scale_by(_surface, (self.zoom, self.zoom)), (min_pos - offset) * self.zoom
-            )
+        if zoom and self.zoom_step != 0:
+            scaled_surface, area = self.scaled_surfaces.get(surface, subrect, self.zoom_step, self.zoom)
+
+            screen.blit(scaled_surface, (min_pos - offset) * self.zoom, area)
+        elif zoom:
+            screen.blit(surface, (min_pos - offset) * self.zoom, subrect)
         else:
-            screen.blit(_surface, min_pos - offset)
+            screen.blit(surface, min_pos - offset, subrect)
@@ -34,7 +34,8 @@ class NetModelAdapter:
         chunk = Chunk(
             Layer(chunk_net_model.blocks), 
             chunk_net_model.position, 
-            Layer(chunk_net_model.structures)
+            Layer(chunk_net_model.structures),
+            chunk_net_model.revision
         )
         
         return chunk
@@ -81,14 +82,22 @@ class ClientNetManager:
         
         return self.net_model_adapter.adapt_player(player_net_model)
 
-    def load_chunk(self, position: tuple[int, int]) -> Optional[Chunk]:
-        chunk_net_model = self.client.load_chunk(position)
+    def load_chunk(self, position: tuple[int, int], chunk: Optional[Chunk] = None) -> Optional[Chunk]:
+        chunk_net_model = self.client.load_chunk(
+            position, None if chunk is None else chunk.revision
+        )
 
         if chunk_net_model is None:
             return None
+        
+        if chunk_net_model.blocks is None:
+            return chunk
 
         return self.net_model_adapter.adapt_chunk(chunk_net_model)
 
+    def subscribe_view(self, position: tuple[int, int], size: tuple[int, int]) -> None:
+        self.client.subscribe_view(position, size)
+
     def move_player(self, position: tuple[int, int], player_id: int) -> None:
         self.client.move_player(position, player_id)
 
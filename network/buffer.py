@@ -0,0 +1,103 @@
+import socket, selectors
+from typing import Iterator, Optional
+
+from .codec import FRAME_HEADER
+
+
+class ReceiveBuffer:
+    data: bytearray
+    start: int
+    end: int
+    needed: int
+    read_size: int
+    min_read_size: int
+    max_read_size: int
+    selector: Optional[selectors.BaseSelector]
+
+    def __init__(self, min_read_size: int = 4096, max_read_size: int = 1 << 20) -> None:
+        self.data = bytearray(min_read_size * 4)
+        self.start = 0
+        self.end = 0
+        self.needed = 0
+        self.read_size = min_read_size
+        self.min_read_size = min_read_size
+        self.max_read_size = max_read_size
+        self.selector = None
+
+    def reserve(self, size: int) -> None:
+        if len(self.data) - self.end >= size:
+            return
+
+        pending = self.end - self.start
+
+        if len(self.data) - pending >= size:
+            self.data[:pending] = self.data[self.start:self.end]
+        else:
+            data = bytearray(max(len(self.data) * 2, pending + size))
+            data[:pending] = self.data[self.start:self.end]
+
+            self.data = data
+
+        self.start = 0
+        self.end = pending
+
+    def recv(self, sock: socket.socket) -> int:
+        read_size = max(self.read_size, self.needed - (self.end - self.start))
+
+        self.reserve(read_size)
+
+        while True:
+            try:
+                size = sock.recv_into(memoryview(self.data)[self.end:self.end + read_size])
+            except BlockingIOError:
+                self.wait(sock)
+
+                continue
+
+            break
+
+        if size == 0:
+            raise ConnectionResetError
+
+        self.end += size
+
+        if size == read_size:
+            self.read_size = min(self.read_size * 2, self.max_read_size)
+        elif size < read_size // 4:
+            self.read_size = max(self.read_size // 2, self.min_read_size)
+
+        return size
+
+    def wait(self, sock: socket.socket) -> None:
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(sock, selectors.EVENT_READ)
+
+        self.selector.select()
+
+    def close(self) -> None:
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+
+    def frames(self) -> Iterator[memoryview]:
+        view = memoryview(self.data)
+
+        while self.end - self.start >= FRAME_HEADER.size:
+            size, = FRAME_HEADER.unpack_from(self.data, self.start)
+            frame_start = self.start + FRAME_HEADER.size
+            frame_end = frame_start + size
+
+            if frame_end > self.end:
+                self.needed = frame_end - self.start
+
+                return
+
+            self.start = frame_end
+
+            yield view[frame_start:frame_end]
+
+        self.needed = 0
+
+        if self.start == self.end:
+            self.start = self.end = 0
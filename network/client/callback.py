@@ -1,22 +1,55 @@
-from typing import Any
-from threading import Event
+from typing import Any, Callable
+from functools import cache
+from threading import Lock, Event
+
+from pydantic import TypeAdapter
+
+
+@cache
+def get_type_adapter(return_type: Any) -> TypeAdapter:
+    return TypeAdapter(return_type)
 
 
 class Callback(Event):
+    lock: Lock
     result: Any
     callback_id: int
+    return_type: Any
+    callbacks: list[Callable]
     
-    def __init__(self, callback_id: int) -> None:
+    def __init__(self, callback_id: int, return_type: Any = None) -> None:
         super().__init__()
         
+        self.lock = Lock()
         self.result = None
         self.callback_id = callback_id
+        self.return_type = return_type
+        self.callbacks = []
     
     def set_result(self, result: Any) -> None:
-        self.result = result
-        self.set()
+        if self.return_type is not None:
+            result = get_type_adapter(self.return_type).validate_python(result)
+
+        with self.lock:
+            self.result = result
+            self.set()
+
+        self.apply_callbacks()
     
-    def wait_result(self) -> None:
+    def wait_result(self) -> Any:
         self.wait()
         
         return self.result
+
+    def add_callback(self, callback: Callable) -> None:
+        with self.lock:
+            if not self.is_set():
+                self.callbacks.append(callback)
+
+                return
+
+        callback(self)
+
+    def apply_callbacks(self) -> None:
+        for callback in self.callbacks:
+            callback(self)
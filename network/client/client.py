@@ -1,10 +1,10 @@
-import time, json, socket
-from typing import Any
-from threading import Lock
-
-from pydantic import TypeAdapter
+import socket
+from typing import Any, Optional
+from threading import Lock, Thread
 
+from network.codec import Codec, BinaryCodec
 from network.methods import Method
+from network.connection import Writer, Connection
 
 from .callback import Callback
 
@@ -12,46 +12,58 @@ from .callback import Callback
 class BaseClient:
     lock: Lock
     sock: socket.socket
+    codec: Codec
+    writer: Writer
+    connection: Connection
     callbacks: dict[int, Callback]
     callbacks_next_id: int
  
-    def __init__(self) -> None:
+    def __init__(
+        self, 
+        codec: Optional[Codec] = None, 
+        address: tuple[str, int] = ("25.51.236.41", 8080)
+    ) -> None:
         self.lock = Lock()
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.connect(("25.51.236.41", 8080))
+        self.sock.connect(address)
+
+        self.codec = codec or BinaryCodec()
+        self.sock.sendall(bytes([self.codec.codec_type]))
+
+        self.writer = Writer()
+        self.connection = Connection(self.sock, self.codec, self.writer)
+        Thread(target=self.writer.run, daemon=True).start()
 
         self.callbacks = {}
         self.callbacks_next_id = 0
  
     def resolve(self, callback: Callback) -> None:
-        result = callback.result
-        callback_id = callback.callback_id
-
         with self.lock:
-            self.callbacks[callback_id].set_result(result)
-            del self.callbacks[callback_id]
+            pending_callback = self.callbacks.pop(callback.callback_id)
+
+        pending_callback.set_result(callback.result)
     
-    def __call__(self, method: Method) -> Any:
+    def __call__(self, method: Method, _async: bool = False) -> Any | Callback:
         with self.lock:
             callback_id = self.callbacks_next_id
             self.callbacks_next_id += 1
             
-            callback = Callback(callback_id)
-            self.callbacks[callback_id] = callback
+            callback = Callback(callback_id, method.return_type)
 
-            self.sock.sendall(
-                json.dumps({
-                    "id": callback_id,
-                    "type": method.method_type,
-                    "data": method.model_dump()
-                }).encode() + b"\n"
-            )
+            if method.return_type is not None:
+                self.callbacks[callback_id] = callback
 
-            time.sleep(0.01)
+        self.connection.send(self.codec.encode_method(method, callback_id))
 
         if method.return_type is None:
+            if _async:
+                callback.set_result(None)
+
+                return callback
+
             return
-        
-        result = callback.wait_result()
 
-        return TypeAdapter(method.return_type).validate_python(result)
+        if _async:
+            return callback
+        
+        return callback.wait_result()
@@ -1,18 +1,16 @@
-import json
 from typing import Callable
 
-from network import Update, UpdatesFactory
+from network import Update
+from network.buffer import ReceiveBuffer
 
 from .client import BaseClient
 
 
 class ClientDispatcher:
     client: BaseClient
-    updates_factory: UpdatesFactory
     
     def __init__(self, client: BaseClient) -> None:
         self.client = client
-        self.updates_factory = UpdatesFactory()
         self.updates_handlers = {
             0: client.resolve
         }
@@ -29,21 +27,21 @@ class ClientDispatcher:
         if function is not None:
             function(update)
 
-    def process_data(self, data: dict) -> None:
-        update = self.updates_factory.from_dict(data)
+    def process_data(self, data: memoryview) -> None:
+        update = self.client.codec.decode_update(data)
 
         self.process_update(update)
 
     def run(self) -> None:
-        all_data = b""
+        buffer = ReceiveBuffer()
 
         while True:
-            all_data += self.client.sock.recv(1024)
-            
-            while True:
-                if all_data.count(b"\n") == 0:
-                    break
+            try:
+                buffer.recv(self.client.sock)
+            except OSError:
+                buffer.close()
 
-                data, _, all_data = all_data.partition(b"\n")
+                return
 
-                self.process_data(json.loads(data))
+            for data in buffer.frames():
+                self.process_data(data)
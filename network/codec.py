@@ -0,0 +1,450 @@
+import sys, json, zlib, struct
+from array import array
+from types import NoneType, UnionType
+from typing import Any, ClassVar, Optional, Union, get_args, get_origin
+from functools import cache
+
+import numpy as np
+from pydantic import BaseModel
+
+from .models import Grid
+from .methods import Method, MethodsFactory
+from .updates import Update, Callback, UpdatesFactory
+
+FRAME_HEADER = struct.Struct("<I")
+METHOD_HEADER = struct.Struct("<BI")
+UPDATE_HEADER = struct.Struct("<B")
+CALLBACK_HEADER = struct.Struct("<IB")
+GRID_HEADER = struct.Struct("<HHB")
+GRID_SIZE = struct.Struct("<I")
+GRID_COMPRESSED = 0x80
+GRID_COMPRESS_MIN_SIZE = 64
+NONE_INT = -2 ** 31
+
+
+def pack_frame(payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+class Layout:
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        ...
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        ...
+
+
+class StructLayout(Layout):
+    fmt: struct.Struct
+    count: int
+    is_tuple: bool
+    has_optionals: bool
+
+    def __init__(self, count: int, is_tuple: bool, has_optionals: bool) -> None:
+        self.fmt = struct.Struct("<" + "i" * count)
+        self.count = count
+        self.is_tuple = is_tuple
+        self.has_optionals = has_optionals
+
+    def flatten(self, values: list[Any]) -> list[int]:
+        if self.is_tuple:
+            values = [ item for value in values for item in value ]
+
+        if self.has_optionals:
+            values = [ NONE_INT if item is None else item for item in values ]
+
+        return values
+
+    def restore(self, values: list[int]) -> list[Any]:
+        if self.has_optionals:
+            values = [ None if item == NONE_INT else item for item in values ]
+
+        if self.is_tuple:
+            values = list(zip(*[iter(values)] * self.count))
+
+        return values
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        buffer += self.fmt.pack(*self.flatten([value]))
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        value, = self.restore(list(self.fmt.unpack_from(data, offset)))
+
+        return value, offset + self.fmt.size
+
+
+class OptionalLayout(Layout):
+    flag: struct.Struct
+    layout: Layout
+
+    def __init__(self, layout: Layout) -> None:
+        self.flag = struct.Struct("<?")
+        self.layout = layout
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        buffer += self.flag.pack(value is not None)
+
+        if value is not None:
+            self.layout.pack(value, buffer)
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        present, = self.flag.unpack_from(data, offset)
+        offset += self.flag.size
+
+        if not present:
+            return None, offset
+
+        return self.layout.unpack(data, offset)
+
+
+class TupleLayout(Layout):
+    layouts: list[Layout]
+
+    def __init__(self, layouts: list[Layout]) -> None:
+        self.layouts = layouts
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        for layout, item in zip(self.layouts, value):
+            layout.pack(item, buffer)
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        items = []
+
+        for layout in self.layouts:
+            item, offset = layout.unpack(data, offset)
+            items.append(item)
+
+        return tuple(items), offset
+
+
+class ListLayout(Layout):
+    count: struct.Struct
+    layout: Layout
+
+    def __init__(self, layout: Layout) -> None:
+        self.count = struct.Struct("<I")
+        self.layout = layout
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        buffer += self.count.pack(len(value))
+
+        if isinstance(self.layout, StructLayout):
+            cells = array("i", self.layout.flatten(value))
+
+            if sys.byteorder == "big":
+                cells.byteswap()
+
+            buffer += cells.tobytes()
+
+            return
+
+        for item in value:
+            self.layout.pack(item, buffer)
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        count, = self.count.unpack_from(data, offset)
+        offset += self.count.size
+
+        if isinstance(self.layout, StructLayout):
+            size = count * self.layout.fmt.size
+            cells = array("i")
+            cells.frombytes(data[offset:offset + size])
+
+            if sys.byteorder == "big":
+                cells.byteswap()
+
+            return self.layout.restore(cells.tolist()), offset + size
+
+        items = [None] * count
+
+        for i in range(count):
+            items[i], offset = self.layout.unpack(data, offset)
+
+        return items, offset
+
+
+class GridLayout(Layout):
+    as_array: bool
+
+    def __init__(self, as_array: bool = False) -> None:
+        self.as_array = as_array
+
+    def get_typecode(self, cells: list[int]) -> str:
+        if not cells:
+            return "B"
+
+        min_value, max_value = min(cells), max(cells)
+
+        if min_value >= 0 and max_value < 256:
+            return "B"
+
+        if min_value >= -128 and max_value < 128:
+            return "b"
+
+        if min_value >= -32768 and max_value < 32768:
+            return "h"
+
+        return "i"
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, np.ndarray):
+            height, width = value.shape
+            typecode = value.dtype.char
+            cells = value.astype("<" + typecode, copy=False).tobytes()
+        else:
+            height = len(value)
+            width = len(value[0]) if height else 0
+
+            cells = []
+
+            for row in value:
+                cells += row
+
+            typecode = self.get_typecode(cells)
+            cells = array(typecode, cells)
+
+            if sys.byteorder == "big":
+                cells.byteswap()
+
+            cells = cells.tobytes()
+
+        if len(cells) >= GRID_COMPRESS_MIN_SIZE:
+            compressed_cells = zlib.compress(cells, 1)
+
+            if len(compressed_cells) < len(cells):
+                buffer += GRID_HEADER.pack(width, height, ord(typecode) | GRID_COMPRESSED)
+                buffer += GRID_SIZE.pack(len(compressed_cells))
+                buffer += compressed_cells
+
+                return
+
+        buffer += GRID_HEADER.pack(width, height, ord(typecode))
+        buffer += cells
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        width, height, typecode = GRID_HEADER.unpack_from(data, offset)
+        offset += GRID_HEADER.size
+
+        cells = array(chr(typecode & ~GRID_COMPRESSED))
+
+        if typecode & GRID_COMPRESSED:
+            size, = GRID_SIZE.unpack_from(data, offset)
+            offset += GRID_SIZE.size
+
+            cells_data = zlib.decompress(data[offset:offset + size])
+        else:
+            size = width * height * cells.itemsize
+            cells_data = data[offset:offset + size]
+
+        if self.as_array:
+            cells = np.frombuffer(cells_data, "<" + cells.typecode).reshape(height, width)
+
+            return cells, offset + size
+
+        cells.frombytes(cells_data)
+
+        if sys.byteorder == "big":
+            cells.byteswap()
+
+        cells = cells.tolist()
+
+        return [ cells[y * width:(y + 1) * width] for y in range(height) ], offset + size
+
+
+class ArrayLayout(GridLayout):
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        super().pack([ list(value) ] if len(value) else [], buffer)
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        rows, offset = super().unpack(data, offset)
+
+        return rows[0] if rows else [], offset
+
+
+class ModelLayout(Layout):
+    model: type[BaseModel]
+    fields: list[tuple[str, Layout]]
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.fields = [
+            (name, compile_layout(field.annotation))
+            for name, field in model.model_fields.items()
+        ]
+
+    def pack(self, value: Any, buffer: bytearray) -> None:
+        for name, layout in self.fields:
+            layout.pack(getattr(value, name), buffer)
+
+    def unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        values = {}
+
+        for name, layout in self.fields:
+            values[name], offset = layout.unpack(data, offset)
+
+        return values, offset
+
+
+@cache
+def compile_layout(annotation: Any) -> Layout:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if annotation is int:
+        return StructLayout(1, False, False)
+
+    if origin in (Union, UnionType) and len(args) == 2 and NoneType in args:
+        return OptionalLayout(compile_layout(args[0] if args[1] is NoneType else args[1]))
+
+    if origin is tuple:
+        if all(arg in (int, Optional[int]) for arg in args):
+            return StructLayout(len(args), True, any(arg != int for arg in args))
+
+        return TupleLayout([ compile_layout(arg) for arg in args ])
+
+    if annotation is Grid:
+        return GridLayout(as_array=True)
+
+    if origin is list:
+        if args[0] is int:
+            return ArrayLayout()
+
+        if args[0] == list[int]:
+            return GridLayout()
+
+        return ListLayout(compile_layout(args[0]))
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return ModelLayout(annotation)
+
+    raise TypeError(f"No binary layout for {annotation!r}")
+
+
+class Codec:
+    codec_type: ClassVar[int]
+
+    def encode_method(self, method: Method, callback_id: int) -> bytes:
+        ...
+
+    def decode_method(self, data: bytes) -> tuple[Method, int]:
+        ...
+
+    def encode_update(self, update: Update) -> bytes:
+        ...
+
+    def decode_update(self, data: bytes) -> Update:
+        ...
+
+
+class JsonCodec(Codec):
+    codec_type = 0
+
+    methods_factory: MethodsFactory
+    updates_factory: UpdatesFactory
+
+    def __init__(self) -> None:
+        self.methods_factory = MethodsFactory()
+        self.updates_factory = UpdatesFactory()
+
+    def encode_method(self, method: Method, callback_id: int) -> bytes:
+        return pack_frame(
+            json.dumps({
+                "id": callback_id,
+                "type": method.method_type,
+                "data": method.model_dump()
+            }).encode()
+        )
+
+    def decode_method(self, data: bytes) -> tuple[Method, int]:
+        method_dict = json.loads(bytes(data))
+
+        return self.methods_factory.from_dict(method_dict), method_dict["id"]
+
+    def encode_update(self, update: Update) -> bytes:
+        return pack_frame(
+            json.dumps({
+                "type": update.update_type,
+                "data": update.model_dump()
+            }).encode()
+        )
+
+    def decode_update(self, data: bytes) -> Update:
+        return self.updates_factory.from_dict(json.loads(bytes(data)))
+
+
+class BinaryCodec(Codec):
+    codec_type = 1
+
+    methods_factory: MethodsFactory
+    updates_factory: UpdatesFactory
+
+    def __init__(self) -> None:
+        self.methods_factory = MethodsFactory()
+        self.updates_factory = UpdatesFactory()
+
+    def get_method_layout(self, method_type: int) -> Layout:
+        return compile_layout(self.methods_factory.data[method_type])
+
+    def get_update_layout(self, update_type: int) -> Layout:
+        return compile_layout(self.updates_factory.data[update_type])
+
+    def get_result_layout(self, method_type: int) -> Layout:
+        return compile_layout(self.methods_factory.data[method_type].return_type)
+
+    def encode_method(self, method: Method, callback_id: int) -> bytes:
+        buffer = bytearray(METHOD_HEADER.pack(method.method_type, callback_id))
+
+        self.get_method_layout(method.method_type).pack(method, buffer)
+
+        return pack_frame(buffer)
+
+    def decode_method(self, data: bytes) -> tuple[Method, int]:
+        method_type, callback_id = METHOD_HEADER.unpack_from(data)
+        values, _ = self.get_method_layout(method_type).unpack(data, METHOD_HEADER.size)
+
+        return self.methods_factory.data[method_type].model_validate(values), callback_id
+
+    def encode_update(self, update: Update) -> bytes:
+        buffer = bytearray(UPDATE_HEADER.pack(update.update_type))
+
+        if isinstance(update, Callback):
+            buffer += CALLBACK_HEADER.pack(update.callback_id, update.method_type)
+
+            self.get_result_layout(update.method_type).pack(update.result, buffer)
+        else:
+            self.get_update_layout(update.update_type).pack(update, buffer)
+
+        return pack_frame(buffer)
+
+    def decode_update(self, data: bytes) -> Update:
+        update_type, = UPDATE_HEADER.unpack_from(data)
+        offset = UPDATE_HEADER.size
+
+        if update_type == Callback.update_type:
+            callback_id, method_type = CALLBACK_HEADER.unpack_from(data, offset)
+            result, _ = self.get_result_layout(method_type).unpack(
+                data, offset + CALLBACK_HEADER.size
+            )
+
+            return Callback(
+                result=result,
+                callback_id=callback_id,
+                method_type=method_type
+            )
+
+        values, _ = self.get_update_layout(update_type).unpack(data, offset)
+
+        return self.updates_factory.data[update_type].model_validate(values)
+
+
+class CodecsFactory:
+    data: dict[int, type[Codec]]
+
+    def __init__(self) -> None:
+        self.data = {
+            0: JsonCodec,
+            1: BinaryCodec
+        }
+
+    def from_type(self, codec_type: int) -> Codec:
+        return self.data[codec_type]()
@@ -0,0 +1,200 @@
+import socket, asyncio
+from typing import Optional
+from threading import Lock, Event
+
+from .codec import Codec
+
+SEND_SIZE = 1 << 16
+MAX_BUFFERED_SIZE = 1 << 23
+WRITE_INTERVAL = 0.005
+
+
+class Writer:
+    lock: Lock
+    event: Event
+    pending: set["Connection"]
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.event = Event()
+        self.pending = set()
+
+    def notify(self, connection: "Connection") -> None:
+        with self.lock:
+            self.pending.add(connection)
+
+        self.event.set()
+
+    def run(self) -> None:
+        blocked: set[Connection] = set()
+
+        while True:
+            self.event.wait(WRITE_INTERVAL if blocked else None)
+            self.event.clear()
+
+            with self.lock:
+                pending = self.pending | blocked
+                self.pending = set()
+
+            blocked = { connection for connection in pending if not connection.flush() }
+
+
+class Connection:
+    lock: Lock
+    sock: socket.socket
+    codec: Codec
+    writer: Optional[Writer]
+    outbound: list[bytes]
+    outbound_size: int
+    unsent: Optional[memoryview]
+    write_lock: Lock
+
+    def __init__(self, sock: socket.socket, codec: Codec, writer: Optional[Writer] = None) -> None:
+        self.lock = Lock()
+        self.sock = sock
+        self.codec = codec
+        self.writer = writer
+        self.outbound = []
+        self.outbound_size = 0
+        self.unsent = None
+        self.write_lock = Lock()
+
+        if writer is not None:
+            sock.setblocking(False)
+
+    def send(self, data: bytes) -> None:
+        with self.lock:
+            overflow = self.outbound_size + len(data) > MAX_BUFFERED_SIZE
+
+            if not overflow:
+                self.outbound.append(data)
+                self.outbound_size += len(data)
+
+        if overflow:
+            self.close()
+        elif self.writer is None:
+            self.flush()
+        else:
+            self.writer.notify(self)
+
+    def send_available(self, data: memoryview) -> int:
+        size = 0
+
+        while size < len(data):
+            try:
+                size += self.sock.send(data[size:size + SEND_SIZE])
+            except BlockingIOError:
+                break
+
+        return size
+
+    def flush(self) -> bool:
+        with self.write_lock:
+            while True:
+                if self.unsent is None:
+                    with self.lock:
+                        if not self.outbound:
+                            return True
+
+                        self.unsent = memoryview(b"".join(self.outbound))
+                        self.outbound.clear()
+
+                unsent = self.unsent
+
+                try:
+                    if self.writer is None:
+                        self.sock.sendall(unsent)
+                        size = len(unsent)
+                    else:
+                        size = self.send_available(unsent)
+                except OSError:
+                    with self.lock:
+                        self.outbound.clear()
+                        self.outbound_size = 0
+
+                    self.unsent = None
+                    self.close()
+
+                    return True
+
+                with self.lock:
+                    self.outbound_size -= size
+
+                if size < len(unsent):
+                    self.unsent = unsent[size:]
+
+                    return False
+
+                self.unsent = None
+
+    def get_outbound_size(self) -> int:
+        return self.outbound_size
+
+    def close(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            ...
+
+
+class AsyncConnection(Connection):
+    loop: asyncio.AbstractEventLoop
+    stream: asyncio.StreamWriter
+    scheduled: bool
+
+    def __init__(
+        self,
+        stream: asyncio.StreamWriter,
+        codec: Codec,
+        loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self.lock = Lock()
+        self.loop = loop
+        self.codec = codec
+        self.stream = stream
+        self.outbound = []
+        self.outbound_size = 0
+        self.scheduled = False
+
+    def send(self, data: bytes) -> None:
+        if self.get_outbound_size() + len(data) > MAX_BUFFERED_SIZE:
+            self.loop.call_soon_threadsafe(self.stream.transport.abort)
+
+            return
+
+        with self.lock:
+            self.outbound.append(data)
+            self.outbound_size += len(data)
+
+            if self.scheduled:
+                return
+
+            self.scheduled = True
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self.loop:
+            self.loop.call_soon(self.flush)
+        else:
+            self.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self) -> bool:
+        with self.lock:
+            data = b"".join(self.outbound)
+            self.outbound.clear()
+            self.outbound_size = 0
+            self.scheduled = False
+
+        if not self.stream.is_closing():
+            self.stream.write(data)
+
+        return True
+
+    def get_outbound_size(self) -> int:
+        return self.outbound_size + self.stream.transport.get_write_buffer_size()
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.stream.close)
@@ -23,6 +23,7 @@ class LoadChunk(Method):
     return_type = ChunkNetModel
     
     position: tuple[int, int]
+    revision: Optional[int] = None
 
 
 class MovePlayer(Method):
@@ -66,6 +67,20 @@ class PlaceStructure(Method):
     structure_type: int
 
 
+class LoadChunks(Method):
+    method_type = 8
+    return_type = list[ChunkNetModel]
+
+    positions: list[tuple[int, int]]
+
+
+class SubscribeView(Method):
+    method_type = 9
+
+    position: tuple[int, int]
+    size: tuple[int, int]
+
+
 class MethodsFactory:
     data: dict[int, type[Method]]
 
@@ -78,7 +93,9 @@ class MethodsFactory:
             4: DamageStructure,
             5: DestroyStructure,
             6: GetPlayers,
-            7: PlaceStructure
+            7: PlaceStructure,
+            8: LoadChunks,
+            9: SubscribeView
         }
 
     def from_dict(self, method_dict: dict) -> Method:
@@ -1,11 +1,30 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+class Grid:
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, 
+        source: Any, 
+        handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            lambda value: np.array(value, np.uint8),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.tolist()
+            )
+        )
 
 
 class ChunkNetModel(BaseModel):
-    blocks: list[list[int]]
+    blocks: Optional[Grid]
     position: tuple[int, int]
-    structures: list[list[int]]
+    revision: int
+    structures: Optional[Grid]
 
 
 class EntityNetModel(BaseModel):
@@ -1,2 +1,4 @@
 from .server import BaseServer as BaseServer
 from .dispatcher import ServerDispatcher as ServerDispatcher
+from .async_dispatcher import AsyncServerDispatcher as AsyncServerDispatcher
+from .tick import TickServer as TickServer
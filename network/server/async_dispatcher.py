@@ -0,0 +1,52 @@
+import asyncio
+
+from network.codec import FRAME_HEADER
+from network.connection import AsyncConnection
+
+from .dispatcher import ServerDispatcher
+
+
+class AsyncServerDispatcher(ServerDispatcher):
+    async def process_stream(
+        self, 
+        reader: asyncio.StreamReader, 
+        writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        connection = None
+
+        try:
+            codec_type = await reader.readexactly(1)
+
+            connection = AsyncConnection(
+                writer, 
+                self.codecs_factory.from_type(codec_type[0]), 
+                loop
+            )
+            self.connections.append(connection)
+
+            while True:
+                size, = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                data = await reader.readexactly(size)
+
+                callback = await loop.run_in_executor(None, self.process_data, data, connection)
+
+                if callback is not None:
+                    self.server(connection, callback)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            ...
+        finally:
+            try:
+                if connection is not None:
+                    self.process_disconnect(connection)
+            finally:
+                writer.close()
+
+    async def serve(self) -> None:
+        server = await asyncio.start_server(self.process_stream, sock=self.server.sock)
+
+        async with server:
+            await server.serve_forever()
+
+    def run(self) -> None:
+        asyncio.run(self.serve())
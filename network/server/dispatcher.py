@@ -1,23 +1,30 @@
-import json, socket
+import socket
 from typing import Any, Callable, Optional
-from threading import Lock, Thread
+from threading import Thread
 
-from network import Method, Callback, MethodsFactory
+from network import Method, Callback
+from network.codec import CodecsFactory
+from network.buffer import ReceiveBuffer
+from network.connection import Writer, Connection
 
 from .server import BaseServer
 
 
 class ServerDispatcher:
     server: BaseServer
-    connections: list[socket.socket]
-    methods_factory: MethodsFactory
+    writer: Writer
+    connections: list[Connection]
+    codecs_factory: CodecsFactory
     methods_handlers: dict[int, Callable]
+    disconnect_handlers: list[Callable[[Connection], None]]
 
     def __init__(self, server: BaseServer) -> None:   
         self.server = server
+        self.writer = Writer()
         self.connections = []
-        self.methods_factory = MethodsFactory()
+        self.codecs_factory = CodecsFactory()
         self.methods_handlers = {}
+        self.disconnect_handlers = []
 
     def on(self, method_type: type[Method]) -> Callable:
         def _(function: Callable) -> None:
@@ -25,47 +32,70 @@ class ServerDispatcher:
         
         return _
 
-    def process_data(self, data: dict) -> Optional[Callback]:
-        method = self.methods_factory.from_dict(data)
-        result = self.process_method(method)
+    def on_disconnect(self, function: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        self.disconnect_handlers.append(function)
+
+        return function
+
+    def process_data(self, data: memoryview, connection: Connection) -> Optional[Callback]:
+        method, callback_id = connection.codec.decode_method(data)
+        result = self.process_method(method, connection)
 
         if result is not None:
             return Callback(
                 result=result,
-                callback_id=data["id"]
+                callback_id=callback_id,
+                method_type=method.method_type
             )
 
-    def process_method(self, method: Method) -> Any:
+    def process_method(self, method: Method, connection: Connection) -> Any:
         function = self.methods_handlers.get(method.method_type)
 
         if function is not None:
-            return function(method)
+            return function(method, connection)
 
-    def process_connection(self, connection: socket.socket) -> None:
-        all_data = b""
+    def process_disconnect(self, connection: Connection) -> None:
+        self.connections.remove(connection)
 
-        while True:
-            try:
-                all_data += connection.recv(1024)
-            except ConnectionError:
-                self.connections.remove(connection)
+        for function in self.disconnect_handlers:
+            function(connection)
+
+    def process_connection(self, sock: socket.socket) -> None:
+        connection = None
+        buffer = ReceiveBuffer()
+
+        try:
+            codec_type = sock.recv(1)
 
+            if not codec_type:
                 return
 
+            connection = Connection(sock, self.codecs_factory.from_type(codec_type[0]), self.writer)
+            self.connections.append(connection)
+
             while True:
-                if all_data.count(b"\n") == 0:
-                    break
+                buffer.recv(sock)
 
-                data, _, all_data = all_data.partition(b"\n")
-                callback = self.process_data(json.loads(data))
+                for data in buffer.frames():
+                    callback = self.process_data(data, connection)
 
-                if callback is not None:
-                    self.server(connection, callback)
+                    if callback is not None:
+                        self.server(connection, callback)
+        except ConnectionError:
+            ...
+        finally:
+            try:
+                if connection is not None:
+                    self.process_disconnect(connection)
+                    connection.close()
+            finally:
+                buffer.close()
+                sock.close()
 
     def run(self) -> None:
+        Thread(target=self.writer.run, daemon=True).start()
+
         while True:
-            connection = self.server.sock.accept()[0]
+            sock = self.server.sock.accept()[0]
 
-            self.server.locks[id(connection)] = Lock()
-            self.connections.append(connection)
-            Thread(target=self.process_connection, args=(connection, )).start()
+            Thread(target=self.process_connection, args=(sock, ), daemon=True).start()
@@ -1,33 +1,38 @@
-import time, json, socket
-from typing import Any
-from threading import Lock
+import socket
+from typing import Any, Optional
 
 from network.updates import Update
+from network.connection import Connection
 
 
 class BaseServer:
     sock: socket.socket
-    locks: dict[int, Lock]
 
-    def __init__(self) -> None:
+    def __init__(self, address: tuple[str, int] = ("25.51.236.41", 8080)) -> None:
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.bind(("25.51.236.41", 8080))
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(address)
         self.sock.listen()
-        self.locks = {}
-
-    def __call__(self, connection: socket.socket, update: Update) -> Any:
-        data = update.model_dump()
-        lock = self.locks.get(id(connection))
-
-        with lock:
-            try:
-                connection.sendall(
-                    json.dumps({
-                        "type": update.update_type,
-                        "data": data
-                    }).encode() + b"\n"
-                )
-            except ConnectionError:
-                ...
-
-            time.sleep(0.01)
+
+    def __call__(self, connection: Connection, update: Update) -> Any:
+        connection.send(connection.codec.encode_update(update))
+
+    def broadcast(
+        self, 
+        update: Update, 
+        connections: list[Connection], 
+        exclude: Optional[Connection] = None
+    ) -> None:
+        encoded: dict[int, bytes] = {}
+
+        for connection in tuple(connections):
+            if connection is exclude:
+                continue
+
+            codec_type = connection.codec.codec_type
+            data = encoded.get(codec_type)
+
+            if data is None:
+                data = encoded[codec_type] = connection.codec.encode_update(update)
+
+            connection.send(data)
@@ -0,0 +1,233 @@
+import time, itertools, traceback
+from typing import Any, Callable, Hashable, Iterator, Optional
+from threading import Lock, RLock
+from collections import deque
+from functools import wraps
+
+from network.updates import Update, InventoryUpdate
+from network.connection import Connection
+
+from .server import BaseServer
+
+TICK_RATE = 20
+MAX_OUTBOUND_SIZE = 1 << 20
+MAX_QUEUED_UPDATES = 4096
+MAX_CONGESTED_TICKS = TICK_RATE * 5
+COALESCED_UPDATES = InventoryUpdate, 
+
+
+def get_update_key(update: Update) -> Optional[Hashable]:
+    if isinstance(update, COALESCED_UPDATES):
+        return update.update_type, update.player_id
+
+
+class TickServer(BaseServer):
+    lock: RLock
+    ticks: int
+    tick_rate: int
+    intents: list[tuple[Callable, tuple]]
+    intents_lock: Lock
+    outbound: dict[Connection, dict[Hashable, Update]]
+    coalescers: dict[int, Callable[[Update, Update], Update]]
+    sequence: Iterator[int]
+    congested: dict[Connection, int]
+    systems: list[Callable[[], None]]
+    durations: deque[float]
+    overruns: int
+    dropped: int
+    disconnected: int
+    queue_depth: int
+    queue_size: int
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("25.51.236.41", 8080),
+        tick_rate: int = TICK_RATE
+    ) -> None:
+        super().__init__(address)
+
+        self.lock = RLock()
+        self.ticks = 0
+        self.tick_rate = tick_rate
+        self.intents = []
+        self.intents_lock = Lock()
+        self.outbound = {}
+        self.coalescers = {}
+        self.sequence = itertools.count()
+        self.congested = {}
+        self.systems = []
+        self.durations = deque(maxlen=tick_rate * 10)
+        self.overruns = 0
+        self.dropped = 0
+        self.disconnected = 0
+        self.queue_depth = 0
+        self.queue_size = 0
+
+    def submit(self, function: Callable, *args: Any) -> None:
+        with self.intents_lock:
+            self.intents.append((function, args))
+
+    def intent(self, function: Callable) -> Callable[..., None]:
+        @wraps(function)
+        def wrapper(*args: Any) -> None:
+            self.submit(function, *args)
+
+        return wrapper
+
+    def on_tick(self, function: Callable[[], None]) -> Callable[[], None]:
+        self.systems.append(function)
+
+        return function
+
+    def coalesce(self, update_type: type[Update]) -> Callable:
+        def _(function: Callable[[Update, Update], Update]) -> Callable[[Update, Update], Update]:
+            self.coalescers[update_type.update_type] = function
+
+            return function
+
+        return _
+
+    def queue(self, connection: Connection, update: Update) -> None:
+        updates = self.outbound.setdefault(connection, {})
+        coalescer = self.coalescers.get(update.update_type)
+
+        if coalescer is not None:
+            key = update.update_type, 
+            pending_update = updates.pop(key, None)
+
+            if pending_update is not None:
+                update = coalescer(pending_update, update)
+                self.dropped += 1
+        else:
+            key = get_update_key(update)
+
+            if key is None:
+                key = next(self.sequence)
+            elif updates.pop(key, None) is not None:
+                self.dropped += 1
+
+        updates[key] = update
+
+    def send(self, connection: Connection, update: Update) -> None:
+        with self.lock:
+            self.queue(connection, update)
+
+    def broadcast(
+        self,
+        update: Update,
+        connections: list[Connection],
+        exclude: Optional[Connection] = None
+    ) -> None:
+        with self.lock:
+            for connection in tuple(connections):
+                if connection is exclude:
+                    continue
+
+                self.queue(connection, update)
+
+    def discard(self, connection: Connection) -> None:
+        with self.lock:
+            self.outbound.pop(connection, None)
+            self.congested.pop(connection, None)
+
+    def hold(self, connection: Connection, updates: dict[Hashable, Update]) -> None:
+        ticks = self.congested[connection] = self.congested.get(connection, 0) + 1
+
+        if ticks > MAX_CONGESTED_TICKS or len(updates) > MAX_QUEUED_UPDATES:
+            del self.congested[connection]
+            self.disconnected += 1
+
+            connection.close()
+        else:
+            self.outbound[connection] = updates
+
+    def flush(self) -> None:
+        outbound = self.outbound
+        self.outbound = {}
+        self.queue_depth = 0
+        self.queue_size = 0
+
+        encoded: dict[tuple[int, int], bytes] = {}
+
+        for connection, updates in outbound.items():
+            size = connection.get_outbound_size()
+
+            self.queue_depth = max(self.queue_depth, len(updates))
+            self.queue_size = max(self.queue_size, size)
+
+            if size > MAX_OUTBOUND_SIZE:
+                self.hold(connection, updates)
+
+                continue
+
+            self.congested.pop(connection, None)
+
+            codec = connection.codec
+            data = []
+
+            for update in updates.values():
+                key = id(update), codec.codec_type
+                encoded_update = encoded.get(key)
+
+                if encoded_update is None:
+                    encoded_update = encoded[key] = codec.encode_update(update)
+
+                data.append(encoded_update)
+
+            connection.send(b"".join(data))
+
+    def tick(self) -> None:
+        start = time.perf_counter()
+
+        with self.lock:
+            with self.intents_lock:
+                intents = self.intents
+                self.intents = []
+
+            for function, args in intents:
+                try:
+                    function(*args)
+                except Exception:
+                    traceback.print_exc()
+
+            for system in self.systems:
+                try:
+                    system()
+                except Exception:
+                    traceback.print_exc()
+
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+
+            self.ticks += 1
+
+        self.durations.append(time.perf_counter() - start)
+
+    def get_tick_stats(self) -> tuple[float, float, int]:
+        durations = tuple(self.durations)
+
+        if not durations:
+            return 0.0, 0.0, self.overruns
+
+        return sum(durations) / len(durations), max(durations), self.overruns
+
+    def get_queue_stats(self) -> tuple[int, int, int, int]:
+        return self.queue_depth, self.queue_size, self.dropped, self.disconnected
+
+    def run_ticks(self) -> None:
+        interval = 1 / self.tick_rate
+        next_tick = time.perf_counter()
+
+        while True:
+            self.tick()
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                self.overruns += 1
+                next_tick = time.perf_counter()
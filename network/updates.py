@@ -18,6 +18,7 @@ class Callback(Update):
 
     result: Any
     callback_id: int
+    method_type: int
 
 
 class PlayerJoin(Update):
@@ -61,6 +62,27 @@ class StructurePlace(Update):
     structure_type: int
 
 
+class ChunkLoad(Update):
+    update_type = 7
+
+    chunk: ChunkNetModel
+
+
+class PlayerSnapshot(Update):
+    update_type = 8
+
+    move_ids: list[int]
+    moves: list[list[int]]
+    position_ids: list[int]
+    positions: list[list[int]]
+
+
+class PlayerLeave(Update):
+    update_type = 9
+
+    player_id: int
+
+
 class UpdatesFactory:
     data: dict[int, type[Update]]
 
@@ -72,7 +94,10 @@ class UpdatesFactory:
             3: InventoryUpdate,
             4: StructureDamage,
             5: StructureDestroy,
-            6: StructurePlace
+            6: StructurePlace,
+            7: ChunkLoad,
+            8: PlayerSnapshot,
+            9: PlayerLeave
         }
 
     def from_dict(self, update_dict: dict) -> Update:        
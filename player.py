@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from pygame.surface import Surface
 
@@ -84,6 +84,7 @@ class PlayerController:
     view: PlayerView
     model: PlayerModel
     net_manager: ClientNetManager
+    net_position: Optional[tuple[int, int]]
 
     inventory: InventoryController
 
@@ -97,6 +98,7 @@ class PlayerController:
         self.view = PlayerView(self, resources_manager)
         self.model = PlayerModel(self.inventory.model.inventory, self)
         self.net_manager = net_manager
+        self.net_position = None
 
     def move(self, amount: tuple[int, int]) -> None:
         position = self.model.player.position
@@ -105,9 +107,13 @@ class PlayerController:
         self.set_position(new_position)
 
     def net_move(self) -> None:
-        self.net_manager.move_player(
-            self.model.player.position, self.model.player.player_id
-        )
+        position = self.model.player.position
+
+        if position == self.net_position:
+            return
+
+        self.net_position = position
+        self.net_manager.move_player(position, self.model.player.player_id)
 
     def set_position(self, position: tuple[int, int]) -> None:
         self.model.player.position = position
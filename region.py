@@ -0,0 +1,191 @@
+import os, mmap, struct
+from typing import BinaryIO, Optional
+from threading import Lock
+from itertools import repeat
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from world import Chunk, Layer, Position, WorldGenerationManager, CHUNK_SIZE
+
+REGION_SIZE = 32
+CHUNK_HEADER = struct.Struct("<?I")
+LAYER_SIZE = CHUNK_SIZE * CHUNK_SIZE
+CHUNK_DATA_SIZE = LAYER_SIZE * 2
+HEADER_SIZE = REGION_SIZE * REGION_SIZE * CHUNK_HEADER.size
+REGION_FILE_SIZE = HEADER_SIZE + REGION_SIZE * REGION_SIZE * CHUNK_DATA_SIZE
+MAX_OPEN_REGIONS = 16
+
+
+def pack_layer(layer: Layer) -> bytes:
+    return layer.data.tobytes()
+
+
+def get_region_path(directory: str, region_position: Position) -> str:
+    return os.path.join(directory, "r.{}.{}.region".format(*region_position))
+
+
+def pregenerate_region(directory: str, seed: int, region_position: Position) -> int:
+    position = region_position[0] * REGION_SIZE, region_position[1] * REGION_SIZE
+    region = RegionFile(get_region_path(directory, region_position))
+
+    try:
+        missing = {
+            (position[0] + x, position[1] + y) 
+            for x in range(REGION_SIZE) 
+            for y in range(REGION_SIZE)
+            if not region.has_chunk((position[0] + x, position[1] + y))
+        }
+
+        if not missing:
+            return 0
+
+        generation_manager = WorldGenerationManager(None, seed)
+        blocks, structures = generation_manager.generate_region(position, (REGION_SIZE, REGION_SIZE))
+
+        for chunk in generation_manager.get_region_chunks(position, blocks, structures):
+            if chunk.position in missing:
+                region.write_chunk(chunk)
+
+        region.flush()
+
+        return len(missing)
+    finally:
+        region.close()
+
+
+class RegionFile:
+    file: BinaryIO
+    mmap: mmap.mmap
+
+    def __init__(self, path: str) -> None:
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                file.truncate(REGION_FILE_SIZE)
+
+        self.file = open(path, "r+b")
+        self.mmap = mmap.mmap(self.file.fileno(), REGION_FILE_SIZE)
+
+    @staticmethod
+    def get_index(position: Position) -> int:
+        return position[1] % REGION_SIZE * REGION_SIZE + position[0] % REGION_SIZE
+
+    def has_chunk(self, position: Position) -> bool:
+        return CHUNK_HEADER.unpack_from(self.mmap, self.get_index(position) * CHUNK_HEADER.size)[0]
+
+    def read_chunk(self, position: Position) -> Optional[Chunk]:
+        index = self.get_index(position)
+        present, revision = CHUNK_HEADER.unpack_from(self.mmap, index * CHUNK_HEADER.size)
+
+        if not present:
+            return None
+
+        offset = HEADER_SIZE + index * CHUNK_DATA_SIZE
+        layers = np.frombuffer(self.mmap, np.uint8, CHUNK_DATA_SIZE, offset).reshape(
+            2, CHUNK_SIZE, CHUNK_SIZE
+        ).copy()
+
+        return Chunk(Layer(layers[0]), position, Layer(layers[1]), revision)
+
+    def write_chunk(self, chunk: Chunk) -> None:
+        index = self.get_index(chunk.position)
+        offset = HEADER_SIZE + index * CHUNK_DATA_SIZE
+
+        self.mmap[offset:offset + CHUNK_DATA_SIZE] = (
+            pack_layer(chunk.blocks) + pack_layer(chunk.structures)
+        )
+        CHUNK_HEADER.pack_into(self.mmap, index * CHUNK_HEADER.size, True, chunk.revision)
+
+    def flush(self) -> None:
+        self.mmap.flush()
+
+    def close(self) -> None:
+        self.mmap.close()
+        self.file.close()
+
+
+class RegionStorage:
+    lock: Lock
+    directory: str
+    regions: OrderedDict[Position, RegionFile]
+
+    def __init__(self, directory: str) -> None:
+        self.lock = Lock()
+        self.directory = directory
+        self.regions = OrderedDict()
+
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_region_position(position: Position) -> Position:
+        return position[0] // REGION_SIZE, position[1] // REGION_SIZE
+
+    def get_region(self, position: Position) -> RegionFile:
+        region_position = self.get_region_position(position)
+        region = self.regions.get(region_position)
+
+        if region is not None:
+            self.regions.move_to_end(region_position)
+
+            return region
+
+        if len(self.regions) >= MAX_OPEN_REGIONS:
+            _, cold_region = self.regions.popitem(last=False)
+            cold_region.flush()
+            cold_region.close()
+
+        region = self.regions[region_position] = RegionFile(
+            get_region_path(self.directory, region_position)
+        )
+
+        return region
+
+    def load_seed(self) -> int:
+        path = os.path.join(self.directory, "seed")
+
+        if not os.path.exists(path):
+            with open(path, "w") as file:
+                file.write(str(int.from_bytes(os.urandom(4), "little")))
+
+        with open(path) as file:
+            return int(file.read())
+
+    def load_chunk(self, position: Position) -> Optional[Chunk]:
+        with self.lock:
+            return self.get_region(position).read_chunk(position)
+
+    def save_chunks(self, chunks: list[Chunk]) -> None:
+        with self.lock:
+            for chunk in chunks:
+                self.get_region(chunk.position).write_chunk(chunk)
+
+    def flush(self) -> None:
+        with self.lock:
+            for region in self.regions.values():
+                region.flush()
+
+    def pregenerate(
+        self, 
+        seed: int, 
+        position: Position, 
+        size: tuple[int, int], 
+        processes: Optional[int] = None
+    ) -> int:
+        min_region = self.get_region_position(position)
+        max_region = self.get_region_position((position[0] + size[0] - 1, position[1] + size[1] - 1))
+
+        region_positions = [
+            (x, y) 
+            for x in range(min_region[0], max_region[0] + 1) 
+            for y in range(min_region[1], max_region[1] + 1)
+        ]
+
+        with self.lock:
+            for region in self.regions.values():
+                region.flush()
+
+            with ProcessPoolExecutor(processes) as executor:
+                return sum(executor.map(
+                    pregenerate_region, repeat(self.directory), repeat(seed), region_positions
+                ))
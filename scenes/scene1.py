@@ -24,10 +24,13 @@ from network.models import (
 from network.updates import (
     PlayerJoin,
     PlayerMove,
+    PlayerLeave,
+    PlayerSnapshot,
     InventoryUpdate,
     StructureDamage,
     StructureDestroy,
-    StructurePlace
+    StructurePlace,
+    ChunkLoad
 )
 
 from client import Client
@@ -88,7 +91,7 @@ class PlacingManager:
         
         self.player.inventory.remove_item_type(1, slot.item_type)
 
-        start_thread(self.world.net_place_structure, cursor_position, item_info.place_structure)
+        self.world.net_place_structure(cursor_position, item_info.place_structure)
 
 
 class DestroyingManager:
@@ -149,7 +152,7 @@ class DestroyingManager:
             for item_type, count in structure_info.drop_items.items():
                 self.player.inventory.add_item_type(count, item_type)
 
-        start_thread(self.world.net_destroy_structure, cursor_position)
+        self.world.net_destroy_structure(cursor_position)
 
 
 class Scene1(Scene):
@@ -158,7 +161,7 @@ class Scene1(Scene):
 
     world: WorldController
     player: Optional[PlayerController]
-    players: list[PlayerController]
+    players: dict[int, PlayerController]
 
     def initialize(self) -> None:
         super().initialize()
@@ -174,39 +177,57 @@ class Scene1(Scene):
         )
         self.world = WorldController(self.net_manager, resources_manager)
         self.player = None
-        self.players = []
+        self.players = {}
 
         @self.dispatcher.on(PlayerJoin)
         def on_player_join(update: PlayerJoin) -> None:
+            if update.player.player_id in self.players:
+                return
+
             player = self.net_manager.net_model_adapter.adapt_player(update.player)
 
-            self.players.append(player)
+            self.players[update.player.player_id] = player
+
+        @self.dispatcher.on(PlayerLeave)
+        def on_player_leave(update: PlayerLeave) -> None:
+            self.players.pop(update.player_id, None)
 
         @self.dispatcher.on(PlayerMove)
         def on_player_move(update: PlayerMove) -> None:
             if self.player is not None and update.player_id == self.player.model.player.player_id:
                 return
 
-            if not self.players:
-                return
+            player = self.players.get(update.player_id)
 
-            player = [
-                player for player in self.players if player.model.player.player_id == update.player_id
-            ][0]
+            if player is None:
+                return
 
             player.set_position(update.position)
 
+        @self.dispatcher.on(PlayerSnapshot)
+        def on_player_snapshot(update: PlayerSnapshot) -> None:
+            for player_id, (x, y) in zip(update.position_ids, update.positions):
+                player = self.players.get(player_id)
+
+                if player is not None and player is not self.player:
+                    player.set_position((x, y))
+
+            for player_id, (dx, dy) in zip(update.move_ids, update.moves):
+                player = self.players.get(player_id)
+
+                if player is not None and player is not self.player:
+                    x, y = player.model.player.position
+                    player.set_position((x + dx, y + dy))
+
         @self.dispatcher.on(InventoryUpdate)
         def on_inventory_update(update: InventoryUpdate) -> None:
             if self.player is not None and update.player_id == self.player.model.player.player_id:
                 return
             
-            if not self.players:
-                return
+            player = self.players.get(update.player_id)
 
-            player = [
-                player for player in self.players if player.model.player.player_id == update.player_id
-            ][0]
+            if player is None:
+                return
 
             inventory = self.net_manager.net_model_adapter.adapt_inventory(update.inventory)
 
@@ -220,15 +241,20 @@ class Scene1(Scene):
         def on_structure_place(update: StructurePlace) -> None:
             self.world.set_structure_type(update.position, update.structure_type)
 
+        @self.dispatcher.on(ChunkLoad)
+        def on_chunk_load(update: ChunkLoad) -> None:
+            chunk = self.net_manager.net_model_adapter.adapt_chunk(update.chunk)
+
+            with self.client.lock:
+                self.world.load_chunks([chunk])
+
         start_thread(self.dispatcher.run)
 
-        self.players += self.net_manager.get_players()
-        self.player = self.net_manager.join_server()
+        for player in self.net_manager.get_players():
+            self.players.setdefault(player.model.player.player_id, player)
 
-        self.player = [
-            player for player in self.players
-            if player.model.player.player_id == self.player.model.player.player_id
-        ][0]
+        player = self.net_manager.join_server()
+        self.player = self.players.setdefault(player.model.player.player_id, player)
 
         self.crafting_menu = CraftingMenuController(
             self.camera, self.player.inventory, resources_manager
@@ -248,8 +274,7 @@ class Scene1(Scene):
             resources_manager
         )
 
-        for position in [(x, y) for x in range(8) for y in range(6)]:
-            start_thread(self.world.net_load_chunk, position)
+        self.world.net_subscribe_view()
 
     def update(self) -> None:
         self.camera.update(False)
@@ -293,7 +318,7 @@ class Scene1(Scene):
         if Keyboard.get_clicked(pg.K_0):
             self.player.inventory.set_selected_slot_id(9)
 
-        position = self.camera.position // self.world.view.tile_map.renderer.tile_size // CHUNK_SIZE
+        position = self.camera.position // self.world.view.tile_size // CHUNK_SIZE
         position -= Vector2(3, 2)
 
         if position != self.world.view.position:
@@ -304,17 +329,17 @@ class Scene1(Scene):
         self.destroying_manager.update()
 
         if self.game.ticks % 5 == 0:
-            start_thread(self.player.net_move)
+            self.player.net_move()
             
         if self.game.ticks % 20 == 0:
-            start_thread(self.player.inventory.net_update, self.player.model.player.player_id)
+            self.player.inventory.net_update(self.player.model.player.player_id)
 
     def draw(self) -> None:
         super().draw()
 
         self.world.draw(self.camera)
 
-        for player in self.players:
+        for player in tuple(self.players.values()):
             player.draw(self.camera)
 
         self.player.inventory.draw(self.camera)
@@ -1,7 +1,9 @@
-import socket, random
+import sys, time, random, itertools
 from typing import Optional
+from threading import Thread
 
-from network.server import BaseServer, ServerDispatcher
+from network.server import TickServer, ServerDispatcher, AsyncServerDispatcher
+from network.connection import Connection
 from network.models import (
     ChunkNetModel, 
     EntityNetModel, 
@@ -16,181 +18,359 @@ from network.methods import (
     DamageStructure,
     DestroyStructure,
     GetPlayers,
-    PlaceStructure
+    PlaceStructure,
+    LoadChunks,
+    SubscribeView
 )
 from network.updates import (
     PlayerJoin,
-    PlayerMove,
+    PlayerLeave,
+    PlayerSnapshot,
     InventoryUpdate,
     StructureDamage,
     StructureDestroy,
-    StructurePlace
+    StructurePlace,
+    ChunkLoad
 )
 
-from world import WorldData, WorldGenerationManager
+from world import Chunk, WorldData, WorldGenerationManager
+from region import RegionStorage
+from journal import Journal, AUTOSAVE_INTERVAL
+from interest import InterestManager
+from snapshots import SnapshotManager, merge_snapshots
 
+PREGENERATION_POSITION = -32, -32
+PREGENERATION_SIZE = 64, 64
 
-class Server(BaseServer):
-    def player_join(self, connection: socket.socket, 
+
+class Server(TickServer):
+    def player_join(self, connections: list[Connection], 
         player: PlayerNetModel
     ) -> None:
-        return self(connection,
+        return self.broadcast(
             PlayerJoin(
                 player=player
-            )
+            ), connections
         )
     
-    def player_move(self, connection: socket.socket, 
-        position: tuple[int, int], 
+    def player_leave(self, connections: list[Connection], 
         player_id: int
     ) -> None:
-        return self(connection,
-            PlayerMove(
-                position=position,
+        return self.broadcast(
+            PlayerLeave(
                 player_id=player_id
-            )
+            ), connections
         )
     
-    def inventory_update(self, connection: socket.socket, 
+    def inventory_update(self, connections: list[Connection], 
         player_id: int,
-        inventory: InventoryNetModel
+        inventory: InventoryNetModel,
+        exclude: Optional[Connection] = None
     ) -> None:
-        return self(connection,
+        return self.broadcast(
             InventoryUpdate(
                 player_id=player_id,
                 inventory=inventory
-            )
+            ), connections, exclude
         )
     
-    def structure_damage(self, connection: socket.socket, 
+    def structure_damage(self, connections: list[Connection], 
         power: int,
         position: tuple[int, int],
         player_id: int
     ) -> None:
-        return self(connection,
+        return self.broadcast(
             StructureDamage(
                 power=power,
                 position=position,
                 player_id=player_id
-            )
+            ), connections
         )
     
-    def structure_destroy(self, connection: socket.socket, 
+    def structure_destroy(self, connections: list[Connection], 
         position: tuple[int, int]
     ) -> None:
-        return self(connection,
+        return self.broadcast(
             StructureDestroy(
                 position=position
-            )
+            ), connections
         )
     
-    def structure_place(self, connection: socket.socket,
+    def structure_place(self, connections: list[Connection],
         position: tuple[int, int],
         structure_type: int                    
     ) -> None:
-        return self(connection,
+        return self.broadcast(
             StructurePlace(
                 position=position,
                 structure_type=structure_type
-            )            
+            ), connections
+        )
+
+    def chunk_load(self, connection: Connection,
+        chunk: ChunkNetModel
+    ) -> None:
+        return self.send(connection,
+            ChunkLoad(
+                chunk=chunk
+            )
+        )
+
+
+def get_chunk_net_model(chunk: Chunk, revision: Optional[int] = None) -> ChunkNetModel:
+    if revision == chunk.revision:
+        return ChunkNetModel(
+            blocks=None,
+            position=chunk.position,
+            revision=chunk.revision,
+            structures=None
+        )
+
+    with world.get_chunk_lock(chunk.position):
+        return ChunkNetModel(
+            blocks=chunk.blocks.data,
+            position=chunk.position,
+            revision=chunk.revision,
+            structures=chunk.structures.data
         )
 
 
 server = Server()
-dp = ServerDispatcher(server)
+
+if "--asyncio" in sys.argv:
+    dp = AsyncServerDispatcher(server)
+else:
+    dp = ServerDispatcher(server)
 
 
 @dp.on(JoinServer)
-def on_join_server(method: JoinServer) -> PlayerNetModel:
-    player = PlayerNetModel(
-        position=(random.randint(0, 400), random.randint(0, 400)), 
-        entity_id=len(players), 
-        player_id=len(players), 
-        inventory=InventoryNetModel(
-            data=[
-                (999, 0),
-                (999, 1),
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, None),
-                (0, None)
-            ], 
-            selected_slot_id=1
+def on_join_server(method: JoinServer, connection: Connection) -> PlayerNetModel:
+    with server.lock:
+        player_id = next(players_ids)
+        player = PlayerNetModel(
+            position=(random.randint(0, 400), random.randint(0, 400)), 
+            entity_id=player_id, 
+            player_id=player_id, 
+            inventory=InventoryNetModel(
+                data=[
+                    (999, 0),
+                    (999, 1),
+                    (0, None),
+                    (0, None),
+                    (0, None),
+                    (0, None),
+                    (0, None),
+                    (0, None),
+                    (0, None),
+                    (0, None)
+                ], 
+                selected_slot_id=1
+            )
         )
-    )
 
-    players.append(player)
+        players[player_id] = player
+        connections_players[connection] = player_id
+        interest_manager.move_player(player.player_id, player.position)
 
-    for connection in dp.connections:
-        server.player_join(connection, player)
+        server.player_join(dp.connections, player)
 
-    return player
+        return player
 
 
 @dp.on(LoadChunk)
-def on_load_chunk(method: LoadChunk) -> Optional[ChunkNetModel]:
-    chunk = world.chunks.get(method.position)
+def on_load_chunk(method: LoadChunk, connection: Connection) -> Optional[ChunkNetModel]:
+    chunk = world.get_chunk(method.position)
 
     if chunk is None:
         return None
     
-    return ChunkNetModel(
-        blocks=chunk.blocks.data,
-        position=method.position,
-        structures=chunk.structures.data
+    return get_chunk_net_model(chunk, method.revision)
+
+
+@dp.on(LoadChunks)
+def on_load_chunks(method: LoadChunks, connection: Connection) -> list[ChunkNetModel]:
+    chunks = []
+
+    for position in method.positions:
+        chunk = world.get_chunk(position)
+
+        if chunk is None:
+            continue
+
+        chunks.append(get_chunk_net_model(chunk))
+
+    return chunks
+
+
+@dp.on(SubscribeView)
+@server.intent
+def on_subscribe_view(method: SubscribeView, connection: Connection) -> None:
+    entered_chunks, left_chunks = interest_manager.subscribe(connection, method.position, method.size)
+
+    for position in left_chunks:
+        chunk = world.get_chunk(position)
+
+        if chunk is not None:
+            interest_manager.set_revision(connection, position, chunk.revision)
+
+    for position in entered_chunks:
+        chunk = world.get_chunk(position)
+
+        if chunk is None:
+            continue
+
+        if interest_manager.get_revision(connection, position) == chunk.revision:
+            continue
+
+        server.chunk_load(connection, get_chunk_net_model(chunk))
+
+    snapshot = snapshot_manager.create_keyframe(
+        connection, interest_manager.get_players(entered_chunks)
     )
 
+    if snapshot is not None:
+        server.send(connection, snapshot)
+
 
 @dp.on(MovePlayer)
-def on_move_player(method: MovePlayer) -> None:
-    player = players[method.player_id]
+@server.intent
+def on_move_player(method: MovePlayer, connection: Connection) -> None:
+    player = players.get(method.player_id)
+
+    if player is None:
+        return
+
     player.position = method.position
 
-    for connection in dp.connections:
-        server.player_move(connection, method.position, method.player_id)
+    interest_manager.move_player(method.player_id, method.position)
+    snapshot_manager.move(method.player_id, method.position)
 
 
 @dp.on(UpdateInventory)
-def on_update_inventory(method: UpdateInventory) -> None:
+@server.intent
+def on_update_inventory(method: UpdateInventory, connection: Connection) -> None:
     inventory = InventoryNetModel(
         data=method.inventory_data, 
         selected_slot_id=method.selected_slot_id
     )
 
-    players[method.player_id].inventory = inventory
+    player = players.get(method.player_id)
 
-    for connection in dp.connections:
-        server.inventory_update(connection, method.player_id, inventory)
+    if player is None:
+        return
+
+    player.inventory = inventory
+
+    server.inventory_update(
+        interest_manager.get_player_subscribers(method.player_id), 
+        method.player_id, inventory, exclude=connection
+    )
 
 
 @dp.on(DestroyStructure)
-def on_damage_structure(method: DestroyStructure) -> None:
+@server.intent
+def on_damage_structure(method: DestroyStructure, connection: Connection) -> None:
     world.set_structure_type(method.position, 0)
     
-    for connection in dp.connections:
-        server.structure_destroy(connection, method.position)
+    server.structure_destroy(
+        interest_manager.get_subscribers(Chunk.get_chunk_position(method.position)), 
+        method.position
+    )
 
 
 @dp.on(GetPlayers)
-def on_get_players(method: GetPlayers) -> list[PlayerNetModel]:
-    return players
+def on_get_players(method: GetPlayers, connection: Connection) -> list[PlayerNetModel]:
+    with server.lock:
+        return list(players.values())
 
 
 @dp.on(PlaceStructure)
-def on_place_structure(method: PlaceStructure) -> None:
+@server.intent
+def on_place_structure(method: PlaceStructure, connection: Connection) -> None:
     world.set_structure_type(method.position, method.structure_type)
     
-    for connection in dp.connections:
-        server.structure_place(connection, method.position, method.structure_type)
+    server.structure_place(
+        interest_manager.get_subscribers(Chunk.get_chunk_position(method.position)), 
+        method.position, method.structure_type
+    )
+
+
+@dp.on_disconnect
+@server.intent
+def on_disconnect(connection: Connection) -> None:
+    server.discard(connection)
+    interest_manager.unsubscribe(connection)
+    snapshot_manager.remove_connection(connection)
+
+    player_id = connections_players.pop(connection, None)
+
+    if player_id is None:
+        return
+
+    del players[player_id]
+
+    interest_manager.remove_player(player_id)
+    snapshot_manager.remove_player(player_id)
+
+    server.player_leave(dp.connections, player_id)
+
+
+server.coalesce(PlayerSnapshot)(merge_snapshots)
+
+
+@server.on_tick
+def send_snapshots() -> None:
+    for snapshot, connections in snapshot_manager.create_snapshots(interest_manager):
+        server.broadcast(snapshot, connections)
+
+
+@server.on_tick
+def print_tick_stats() -> None:
+    if "--tick-stats" not in sys.argv or server.ticks % (server.tick_rate * 10):
+        return
+
+    mean_duration, max_duration, overruns = server.get_tick_stats()
+    queue_depth, queue_size, dropped, disconnected = server.get_queue_stats()
+
+    print(
+        f"tick {server.ticks}: mean {mean_duration * 1000:.2f} ms, "
+        f"max {max_duration * 1000:.2f} ms, overruns {overruns}, "
+        f"queue {queue_depth} updates / {queue_size} bytes, "
+        f"dropped {dropped}, disconnected {disconnected}"
+    )
+
+
+def autosave() -> None:
+    while True:
+        time.sleep(AUTOSAVE_INTERVAL)
+
+        world.save_dirty_chunks()
+        world.evict_chunks()
+
+
+world = WorldData(RegionStorage("regions"), Journal("regions"))
+players: dict[int, PlayerNetModel] = {}
+players_ids = itertools.count()
+connections_players: dict[Connection, int] = {}
+interest_manager = InterestManager()
+snapshot_manager = SnapshotManager()
+generation_manager = WorldGenerationManager(world, world.storage.load_seed())
+
+if "--pregenerate" in sys.argv:
+    start = time.perf_counter()
+    generated = world.storage.pregenerate(
+        generation_manager.seed, PREGENERATION_POSITION, PREGENERATION_SIZE
+    )
+
+    print(f"pregenerated {generated} chunks in {time.perf_counter() - start:.2f} s")
 
+world.generator = generation_manager.generate_chunk
+world.recover()
 
-world = WorldData()
-players: list[PlayerNetModel] = []
-generation_manager = WorldGenerationManager(world)
-generation_manager.generate_chunks((20, 10))
+Thread(target=autosave, daemon=True).start()
+Thread(target=server.run_ticks, daemon=True).start()
 
-dp.run()
+try:
+    dp.run()
+finally:
+    world.save_dirty_chunks()
@@ -0,0 +1,141 @@
+from typing import Optional
+from threading import Lock
+
+from network.updates import PlayerSnapshot
+from network.connection import Connection
+
+from world import Position
+from interest import InterestManager
+
+KEYFRAME_INTERVAL = 40
+
+
+def merge_snapshots(snapshot: PlayerSnapshot, next_snapshot: PlayerSnapshot) -> PlayerSnapshot:
+    moves = dict(zip(snapshot.move_ids, map(tuple, snapshot.moves)))
+    positions = dict(zip(snapshot.position_ids, map(tuple, snapshot.positions)))
+
+    for player_id, (dx, dy) in zip(next_snapshot.move_ids, next_snapshot.moves):
+        if player_id in positions:
+            x, y = positions[player_id]
+            positions[player_id] = x + dx, y + dy
+        else:
+            x, y = moves.get(player_id, (0, 0))
+            moves[player_id] = x + dx, y + dy
+
+    for player_id, (x, y) in zip(next_snapshot.position_ids, next_snapshot.positions):
+        moves.pop(player_id, None)
+        positions[player_id] = x, y
+
+    return PlayerSnapshot(
+        move_ids=list(moves),
+        moves=[ [dx, dy] for dx, dy in moves.values() ],
+        position_ids=list(positions),
+        positions=[ [x, y] for x, y in positions.values() ]
+    )
+
+
+class SnapshotManager:
+    lock: Lock
+    ticks: int
+    moved: set[int]
+    positions: dict[int, Position]
+    baselines: dict[Connection, dict[int, Position]]
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.ticks = 0
+        self.moved = set()
+        self.positions = {}
+        self.baselines = {}
+
+    def move(self, player_id: int, position: Position) -> None:
+        with self.lock:
+            if self.positions.get(player_id) == position:
+                return
+
+            self.positions[player_id] = position
+            self.moved.add(player_id)
+
+    def remove_player(self, player_id: int) -> None:
+        with self.lock:
+            self.moved.discard(player_id)
+            self.positions.pop(player_id, None)
+
+            for baseline in self.baselines.values():
+                baseline.pop(player_id, None)
+
+    def remove_connection(self, connection: Connection) -> None:
+        with self.lock:
+            self.baselines.pop(connection, None)
+
+    def create_snapshot(self, moved: list[int], baseline: dict[int, Position]) -> PlayerSnapshot:
+        move_ids = []
+        moves = []
+        position_ids = []
+        positions = []
+
+        for player_id in moved:
+            x, y = self.positions[player_id]
+            previous_position = baseline.get(player_id)
+
+            if previous_position is None:
+                position_ids.append(player_id)
+                positions.append([x, y])
+            else:
+                move_ids.append(player_id)
+                moves.append([x - previous_position[0], y - previous_position[1]])
+
+            baseline[player_id] = x, y
+
+        return PlayerSnapshot(
+            move_ids=move_ids,
+            moves=moves,
+            position_ids=position_ids,
+            positions=positions
+        )
+
+    def create_keyframe(self, connection: Connection, player_ids: list[int]) -> Optional[PlayerSnapshot]:
+        with self.lock:
+            baseline = self.baselines.setdefault(connection, {})
+
+            for player_id in player_ids:
+                baseline.pop(player_id, None)
+
+            player_ids = [ player_id for player_id in player_ids if player_id in self.positions ]
+
+            if not player_ids:
+                return None
+
+            return self.create_snapshot(player_ids, baseline)
+
+    def create_snapshots(self, interest_manager: InterestManager) -> list[tuple[PlayerSnapshot, list[Connection]]]:
+        with self.lock:
+            moved = sorted(self.moved)
+            self.moved.clear()
+            self.ticks += 1
+
+            if self.ticks % KEYFRAME_INTERVAL == 0:
+                self.baselines.clear()
+
+            recipients: dict[Connection, list[int]] = {}
+
+            for player_id in moved:
+                for connection in interest_manager.get_player_subscribers(player_id):
+                    recipients.setdefault(connection, []).append(player_id)
+
+            groups: dict[tuple, tuple[PlayerSnapshot, list[Connection]]] = {}
+
+            for connection, player_ids in recipients.items():
+                baseline = self.baselines.setdefault(connection, {})
+                snapshot = self.create_snapshot(player_ids, baseline)
+                key = (
+                    tuple(snapshot.move_ids), tuple(map(tuple, snapshot.moves)),
+                    tuple(snapshot.position_ids), tuple(map(tuple, snapshot.positions))
+                )
+
+                if key not in groups:
+                    groups[key] = snapshot, []
+
+                groups[key][1].append(connection)
+
+            return list(groups.values())
@@ -1,24 +1,39 @@
 from __future__ import annotations
 
-import random
-from copy import deepcopy
 from typing import Any, Callable, Optional, TYPE_CHECKING
-from threading import Thread
+from threading import Lock, RLock, Thread
+from itertools import islice
+from collections import OrderedDict
 
+import numpy as np
+import pygame as pg
 from pygame.math import Vector2
+from pygame.surface import Surface
 
 from kit.math import vector2tuple
 from kit.graphics import Camera
-from kit.components.tile_map import TileMapComponent
 
+from journal import Journal, BLOCKS_LAYER, STRUCTURES_LAYER
 from resources import ResourcesManager
 
 if TYPE_CHECKING:
+    from region import RegionStorage
     from net_manager import ClientNetManager
 
 Position = tuple[int, int]
 
 CHUNK_SIZE = 16
+SMOOTHING_PASSES = 4
+GENERATION_MARGIN = SMOOTHING_PASSES
+GENERATION_BAND_SIZE = CHUNK_SIZE * 16
+CHUNK_SURFACES_BUDGET = 96 << 20
+CHUNK_RENDERS_PER_FRAME = 1
+LOCK_STRIPES = 64
+HASH_MASK = 2 ** 64 - 1
+HASH_X = 0x9E3779B97F4A7C15
+HASH_Y = 0xC2B2AE3D27D4EB4F
+HASH_SEED = 0x165667B19E3779F9
+HASH_STREAM = 0xD6E8FEB86659FD93
 DIRECTIONS4 = [ 
     (-1, 0), (0, 1), (1, 0), (0, -1) 
 ]
@@ -35,9 +50,9 @@ def start_thread(function: Callable, *args: Any) -> None:
 
 
 class Layer:
-    data: list[list[int]]
+    data: np.ndarray
 
-    def __init__(self, data: list[list[int]]) -> None:
+    def __init__(self, data: np.ndarray) -> None:
         self.data = data
 
     @classmethod
@@ -47,29 +62,37 @@ class Layer:
         else:
             width, height = CHUNK_SIZE, CHUNK_SIZE
 
-        return Layer([ [value] * width for _ in range(height) ])
+        return Layer(np.full((height, width), value, np.uint8))
 
-    def __getitem__(self, position: Position) -> None:
+    def copy(self) -> Layer:
+        return Layer(self.data.copy())
+
+    def __getitem__(self, position: Position) -> int:
         x, y = position
 
-        return self.data[y][x]
+        return int(self.data[y, x])
 
     def __setitem__(self, position: Position, value: int) -> None:
         x, y = position
         
-        self.data[y][x] = value
+        self.data[y, x] = value
 
 
 class Chunk:
     blocks: Layer
     position: Position
+    revision: int
     structures: Layer
     
-    def __init__(self, blocks: Layer, position: Position, structures: Layer) -> None:
+    def __init__(self, blocks: Layer, position: Position, structures: Layer, revision: int = 0) -> None:
         self.blocks = blocks
         self.position = position
+        self.revision = revision
         self.structures = structures
 
+    def copy(self) -> Chunk:
+        return Chunk(self.blocks.copy(), self.position, self.structures.copy(), self.revision)
+
     @staticmethod
     def get_chunk_position(position: Position) -> tuple[int, int]:
         return position[0] // CHUNK_SIZE, position[1] // CHUNK_SIZE
@@ -80,15 +103,183 @@ class Chunk:
 
 
 class WorldData:
+    lock: RLock
+    locks: list[RLock]
+    save_lock: Lock
+    dirty: set[Position]
+    saving: set[Position]
     chunks: dict[Position, Chunk]
-
-    def __init__(self) -> None:
+    journal: Optional[Journal]
+    storage: Optional[RegionStorage]
+    generator: Optional[Callable[[Position], Chunk]]
+    max_chunks: int
+
+    def __init__(
+        self, 
+        storage: Optional[RegionStorage] = None, 
+        journal: Optional[Journal] = None,
+        generator: Optional[Callable[[Position], Chunk]] = None,
+        max_chunks: int = 4096
+    ) -> None:
+        self.lock = RLock()
+        self.locks = [ RLock() for _ in range(LOCK_STRIPES) ]
+        self.save_lock = Lock()
+        self.dirty = set()
+        self.saving = set()
         self.chunks = {}
+        self.journal = journal
+        self.storage = storage
+        self.generator = generator
+        self.max_chunks = max_chunks
+
+    def get_chunk_lock(self, position: Position) -> RLock:
+        return self.locks[hash(position) % LOCK_STRIPES]
+
+    def lock_chunks(self) -> None:
+        for lock in self.locks:
+            lock.acquire()
+
+    def unlock_chunks(self) -> None:
+        for lock in reversed(self.locks):
+            lock.release()
+
+    def get_cached_chunk(self, position: Position) -> Optional[Chunk]:
+        with self.lock:
+            chunk = self.chunks.pop(position, None)
+
+            if chunk is not None:
+                self.chunks[position] = chunk
+
+            return chunk
+
+    def get_chunk(self, position: Position) -> Optional[Chunk]:
+        if self.storage is None and self.generator is None:
+            return self.chunks.get(position)
+
+        chunk = self.get_cached_chunk(position)
+
+        if chunk is not None:
+            return chunk
+
+        with self.get_chunk_lock(position):
+            chunk = self.get_cached_chunk(position)
+
+            if chunk is not None:
+                return chunk
+
+            if self.storage is not None:
+                chunk = self.storage.load_chunk(position)
+
+            generated = chunk is None
+
+            if generated:
+                if self.generator is None:
+                    return None
+
+                chunk = self.generator(position)
+
+            with self.lock:
+                self.chunks[position] = chunk
+
+                if generated:
+                    self.dirty.add(position)
+
+            return chunk
+
+    def evict_chunks(self) -> None:
+        with self.lock:
+            positions = list(islice(
+                (
+                    position for position in self.chunks 
+                    if position not in self.dirty and position not in self.saving
+                ),
+                max(len(self.chunks) - self.max_chunks, 0)
+            ))
+
+        for position in positions:
+            with self.get_chunk_lock(position):
+                with self.lock:
+                    if position in self.dirty or position in self.saving:
+                        continue
+
+                    self.chunks.pop(position, None)
+
+    def save_chunks(self) -> None:
+        with self.lock:
+            chunks = list(self.chunks.values())
+
+        self.storage.save_chunks(chunks)
+        self.storage.flush()
+
+    def save_dirty_chunks(self) -> None:
+        with self.save_lock:
+            journal = self.journal
+
+            if journal is not None:
+                segments = journal.get_segments()
+                fd = journal.open_next_segment()
+
+            self.lock_chunks()
+
+            try:
+                with self.lock:
+                    chunks = [
+                        self.chunks[position].copy() for position in self.dirty 
+                        if position in self.chunks
+                    ]
+
+                    if journal is not None:
+                        fd = journal.swap_segment(fd)
+
+                    self.saving = set(self.dirty)
+                    self.dirty.clear()
+            finally:
+                self.unlock_chunks()
+
+            if journal is not None:
+                journal.close_segment(fd)
+
+            try:
+                self.storage.save_chunks(chunks)
+                self.storage.flush()
+            finally:
+                with self.lock:
+                    self.saving = set()
+
+            if journal is not None:
+                journal.remove(segments)
+
+    def recover(self) -> None:
+        journal = self.journal
+        self.journal = None
+
+        for layer, position, value in journal.read():
+            try:
+                if layer == BLOCKS_LAYER:
+                    self.set_block_type(position, value)
+                else:
+                    self.set_structure_type(position, value)
+            except KeyError:
+                continue
+
+        self.journal = journal
+        self.save_dirty_chunks()
 
     def set_block_type(self, position: Position, block_type: int) -> None:
-        chunk, element_position = self.get_chunk_by_element_position(position)
+        with self.get_chunk_lock(Chunk.get_chunk_position(position)):
+            chunk, element_position = self.get_chunk_by_element_position(position)
+
+            if chunk.blocks[element_position] == block_type:
+                return
+
+            chunk.blocks[element_position] = block_type
+            chunk.revision += 1
+
+            with self.lock:
+                self.dirty.add(chunk.position)
 
-        chunk.blocks[element_position] = block_type
+            if self.journal is not None:
+                self.journal.append(BLOCKS_LAYER, position, block_type)
 
     def get_block_type(self, position: Position) -> int:
         chunk, element_position = self.get_chunk_by_element_position(position)
@@ -96,9 +287,20 @@ class WorldData:
         return chunk.blocks[element_position]
 
     def set_structure_type(self, position: Position, structure_type: int) -> None:
-        chunk, element_position = self.get_chunk_by_element_position(position)
+        with self.get_chunk_lock(Chunk.get_chunk_position(position)):
+            chunk, element_position = self.get_chunk_by_element_position(position)
+
+            if chunk.structures[element_position] == structure_type:
+                return
+
+            chunk.structures[element_position] = structure_type
+            chunk.revision += 1
+
+            with self.lock:
+                self.dirty.add(chunk.position)
 
-        chunk.structures[element_position] = structure_type
+            if self.journal is not None:
+                self.journal.append(STRUCTURES_LAYER, position, structure_type)
 
     def get_structure_type(self, position: Position) -> int:
         chunk, element_position = self.get_chunk_by_element_position(position)
@@ -106,8 +308,9 @@ class WorldData:
         return chunk.structures[element_position]
 
     def load_chunks(self, chunks: Chunk) -> None:
-        for chunk in chunks:
-            self.chunks[chunk.position] = chunk
+        with self.lock:
+            for chunk in chunks:
+                self.chunks[chunk.position] = chunk
 
     def unload_chunks(self, *positions: Position) -> None:
         for position in positions:
@@ -116,12 +319,16 @@ class WorldData:
     def get_chunk_by_element_position(self, position: Position) -> tuple[Chunk, Position]:
         chunk_position = Chunk.get_chunk_position(position)
         element_position = Chunk.get_element_position(position)
+        chunk = self.get_chunk(chunk_position)
+
+        if chunk is None:
+            raise KeyError(chunk_position)
 
-        return self.chunks[chunk_position], element_position
+        return chunk, element_position
 
     def copy_data(self, size: tuple[int, int], position: Position) -> tuple[Layer, Layer]:
-        blocks = [ [0] * size[0] for _ in range(size[1]) ]
-        structures = [ [0] * size[0] for _ in range(size[1]) ]
+        blocks = Layer.filled(0, size)
+        structures = Layer.filled(0, size)
 
         for cx in range(size[0] // CHUNK_SIZE):
             for cy in range(size[1] // CHUNK_SIZE):
@@ -131,17 +338,12 @@ class WorldData:
                     continue
 
                 chunk = self.chunks[chunk_position]
+                dx, dy = cx * CHUNK_SIZE, cy * CHUNK_SIZE
 
-                for x in range(CHUNK_SIZE):
-                    dx = x + cx * CHUNK_SIZE
+                blocks.data[dy:dy + CHUNK_SIZE, dx:dx + CHUNK_SIZE] = chunk.blocks.data
+                structures.data[dy:dy + CHUNK_SIZE, dx:dx + CHUNK_SIZE] = chunk.structures.data
 
-                    for y in range(CHUNK_SIZE):
-                        dy = y + cy * CHUNK_SIZE
-                        
-                        blocks[dy][dx] = chunk.blocks.data[y][x]
-                        structures[dy][dx] = chunk.structures.data[y][x]
-
-        return Layer(blocks), Layer(structures)
+        return blocks, structures
     
     def is_position_inside(self, position: Position) -> bool:
         chunk_position = Chunk.get_chunk_position(position)
@@ -169,213 +371,342 @@ class WorldModel:
         self.data.set_structure_type(position, structure_type)
 
 
-class BlocksManager:
-    size: tuple[int, int]
-    tile_map: TileMapComponent
+class ChunkRenderer:
+    tile_size: int
+    textures: list[Surface]
+    blocks_rules: np.ndarray
+    structures_rules: dict[int, list[list[int]]]
+    structures_margin: tuple[int, int]
 
-    blocks: Layer
-    blocks_rules: dict[int, list[int]]
+    def __init__(self, resources_manager: ResourcesManager, tile_size: int = 32) -> None:
+        self.tile_size = tile_size
+        self.textures = resources_manager.textures
+        self.blocks_rules = np.full((256, 16), -1, np.int16)
+        self.structures_rules = resources_manager.structures_rules
+        self.structures_margin = (
+            max(len(row) for structure in self.structures_rules.values() for row in structure) - 1,
+            max(len(structure) for structure in self.structures_rules.values()) - 1
+        )
 
-    def __init__(self, tile_map: TileMapComponent, resources_manager: ResourcesManager) -> None:
-        self.size = tile_map.size
-        self.tile_map = tile_map
-        
-        self.blocks = Layer.filled(0, size=self.size)
-        self.blocks_rules = resources_manager.blocks_rules
+        for block_type, rules in resources_manager.blocks_rules.items():
+            self.blocks_rules[block_type] = rules
+
+    def create_surface(self) -> Surface:
+        return Surface((CHUNK_SIZE * self.tile_size, CHUNK_SIZE * self.tile_size), pg.SRCALPHA)
+
+    def get_edges(self, neighbours: tuple[Optional[Chunk], ...]) -> tuple:
+        left, top, right, bottom, bottom_left = neighbours
+        mx, my = self.structures_margin
+
+        return (
+            None if left is None else (
+                left.blocks.data[:, -1].tobytes(), left.structures.data[:, CHUNK_SIZE - mx:].tobytes()
+            ),
+            None if top is None else top.blocks.data[-1].tobytes(),
+            None if right is None else right.blocks.data[:, 0].tobytes(),
+            None if bottom is None else (
+                bottom.blocks.data[0].tobytes(), bottom.structures.data[:my].tobytes()
+            ),
+            None if bottom_left is None else (
+                bottom_left.structures.data[:my, CHUNK_SIZE - mx:].tobytes()
+            )
+        )
 
-    def update_block_texture(self, position: tuple[int, int]) -> None:
-        x, y = position
-        tile = self.tile_map.data.get_tile(position)
-        block_type = self.blocks.data[y][x]
+    def get_blocks_blits(self, chunk: Chunk, neighbours: tuple[Optional[Chunk], ...]) -> list[tuple[Surface, Position]]:
+        left, top, right, bottom, _ = neighbours
+        blocks = np.zeros((CHUNK_SIZE + 2, CHUNK_SIZE + 2), np.uint8)
+        blocks[1:-1, 1:-1] = chunk.blocks.data
+
+        if left is not None:
+            blocks[1:-1, 0] = left.blocks.data[:, -1]
+        if top is not None:
+            blocks[0, 1:-1] = top.blocks.data[-1]
+        if right is not None:
+            blocks[1:-1, -1] = right.blocks.data[:, 0]
+        if bottom is not None:
+            blocks[-1, 1:-1] = bottom.blocks.data[0]
+
+        center = blocks[1:-1, 1:-1]
+        variations = (
+            (blocks[1:-1, :-2] == center) | 
+            (blocks[2:, 1:-1] == center) << 1 | 
+            (blocks[1:-1, 2:] == center) << 2 | 
+            (blocks[:-2, 1:-1] == center) << 3
+        )
+        texture_ids = self.blocks_rules[center, variations]
+        texture_ids[center == 0] = -1
 
-        if block_type == 0:
-            return tile.remove_value(0, 0)
+        return [
+            (self.textures[texture_ids[y, x]], (x * self.tile_size, y * self.tile_size))
+            for y, x in zip(*np.nonzero(texture_ids >= 0))
+        ]
 
-        variation = 0
+    def get_structures_blits(self, chunk: Chunk, neighbours: tuple[Optional[Chunk], ...]) -> list[tuple[Surface, Position]]:
+        left, _, _, bottom, bottom_left = neighbours
+        layers: dict[int, list[tuple[Surface, Position]]] = {}
 
-        for i, (dx, dy) in enumerate(DIRECTIONS4):
-            tx, ty = x + dx, y + dy
-            
-            if tx < 0 or ty < 0 or tx >= self.size[0] or ty >= self.size[1]:
+        for source, dx, dy in (
+            (chunk, 0, 0), (left, -CHUNK_SIZE, 0), 
+            (bottom, 0, CHUNK_SIZE), (bottom_left, -CHUNK_SIZE, CHUNK_SIZE)
+        ):
+            if source is None:
                 continue
 
-            if self.blocks.data[ty][tx] == block_type:
-                variation |= 2 ** i
+            structures = source.structures.data
 
-        tile.set_value(self.blocks_rules[block_type][variation], 0, 0)
-    
-    def set_block_type(self, position: tuple[int, int], block_type: int) -> None:
-        x, y = position
+            for y, x in zip(*structures.nonzero()):
+                structure = self.structures_rules[int(structures[y, x])]
 
-        self.blocks[position] = block_type
-        self.update_block_texture(position)
+                for oy, row in enumerate(structure):
+                    ty = y + dy - oy
 
-        for dx, dy in DIRECTIONS4:
-            nx, ny = x + dx, y + dy
+                    if ty < 0 or ty >= CHUNK_SIZE:
+                        continue
 
-            if nx < 0 or ny < 0 or nx >= self.size[0] or ny >= self.size[1]:
-                continue
+                    for ox, texture_id in enumerate(row):
+                        tx = x + dx + ox
 
-            self.update_block_texture((nx, ny))
+                        if 0 <= tx < CHUNK_SIZE:
+                            layers.setdefault(oy, []).append(
+                                (self.textures[texture_id], (tx * self.tile_size, ty * self.tile_size))
+                            )
 
+        return [ blit for z_index in sorted(layers) for blit in layers[z_index] ]
 
-class StructuresManager:
-    size: tuple[int, int]
-    tile_map: TileMapComponent
+    def render(
+        self, 
+        chunk: Chunk, 
+        neighbours: tuple[Optional[Chunk], ...], 
+        surface: Optional[Surface] = None
+    ) -> Surface:
+        if surface is None:
+            surface = self.create_surface()
+        else:
+            surface.fill((0, 0, 0, 0))
+            Camera.invalidate(surface)
 
-    structures: Layer
-    structures_rules: dict[int, list[int]]
+        surface.blits(self.get_blocks_blits(chunk, neighbours), False)
+        surface.blits(self.get_structures_blits(chunk, neighbours), False)
 
-    def __init__(self, tile_map: TileMapComponent, resources_manager: ResourcesManager) -> None:
-        self.size = tile_map.size
-        self.tile_map = tile_map
-        
-        self.structures = Layer.filled(0, size=self.size)
-        self.structures_rules = resources_manager.structures_rules
+        return surface
 
-    def set_structure_type(self, position: tuple[int, int], structure_type: int) -> None:
-        prev_structure_type = self.structures[position]
 
-        if structure_type == prev_structure_type:
-            return
-        
-        if structure_type == 0:
-            self.remove_structure_type(position, prev_structure_type)
-        else:
-            self.blit_structure_type(position, structure_type)
+class ChunkSurface:
+    revisions: tuple[Optional[int], ...]
+    edges: tuple
+    surface: Surface
 
-        self.structures[position] = structure_type
+    def __init__(self, revisions: tuple[Optional[int], ...], edges: tuple, surface: Surface) -> None:
+        self.revisions = revisions
+        self.edges = edges
+        self.surface = surface
 
-    def blit_structure_type(self, position: tuple[int, int], structure_type: int) -> None:
-        x, y = position
-        structure = self.structures_rules[structure_type]
 
-        for oy, row in enumerate(structure):
-            ty = y - oy
+class ChunkSurfacesCache:
+    size: int
+    max_size: int
+    surfaces: OrderedDict[Position, ChunkSurface]
 
-            if ty < 0:
-                break
-            
-            for ox, texture_id in enumerate(row):
-                tx = x + ox
+    def __init__(self, max_size: int = CHUNK_SURFACES_BUDGET) -> None:
+        self.size = 0
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
 
-                if tx >= self.size[0]:
-                    continue
+    @staticmethod
+    def get_surface_size(surface: Surface) -> int:
+        width, height = surface.get_size()
 
-                tile = self.tile_map.data.get_tile((tx, ty))
-                tile.set_value(texture_id, oy, 1)
+        return width * height * surface.get_bytesize()
 
-    def remove_structure_type(self, position: tuple[int, int], structure_type: int) -> None:
-        x, y = position
-        structure = self.structures_rules[structure_type]
+    def get(self, position: Position) -> Optional[ChunkSurface]:
+        chunk_surface = self.surfaces.get(position)
 
-        for oy, row in enumerate(structure):
-            ty = y - oy
+        if chunk_surface is not None:
+            self.surfaces.move_to_end(position)
 
-            if ty < 0:
-                break
-            
-            for ox, _ in enumerate(row):
-                tx = x + ox
+        return chunk_surface
 
-                if tx >= self.size[0]:
-                    continue
+    def set(self, position: Position, chunk_surface: ChunkSurface) -> None:
+        prev_chunk_surface = self.surfaces.pop(position, None)
+
+        if prev_chunk_surface is not None:
+            self.size -= self.get_surface_size(prev_chunk_surface.surface)
+
+        self.surfaces[position] = chunk_surface
+        self.size += self.get_surface_size(chunk_surface.surface)
 
-                tile = self.tile_map.data.get_tile((tx, ty))
-                tile.remove_value(oy, 1)
+        while self.size > self.max_size and len(self.surfaces) > 1:
+            _, cold_chunk_surface = self.surfaces.popitem(last=False)
+            self.size -= self.get_surface_size(cold_chunk_surface.surface)
 
 
 class WorldView:
     controller: WorldController
     resources_manager: ResourcesManager
 
-    tile_map: TileMapComponent
+    size: tuple[int, int]
     position: Position
-    
-    blocks_manager: BlocksManager
-    structures_manager: StructuresManager
+    tile_size: int
+
+    renderer: ChunkRenderer
+    surfaces: ChunkSurfacesCache
+
+    lock: Lock
+    slots: list[Optional[Surface]]
+    pending: set[Position]
 
     def __init__(self, controller: WorldController, resources_manager: ResourcesManager) -> None:
         self.controller = controller
         self.resources_manager = resources_manager
 
-        self.tile_map = TileMapComponent(
-            (96, 64), controller.resources_manager.textures
-        )
-        self.tile_map.data.add_layer(0)
-        self.tile_map.data.add_layer(0)
+        self.size = 96, 64
         self.position = 0, 0
+        self.tile_size = 32
 
-        self.blocks_manager = BlocksManager(self.tile_map, resources_manager)
-        self.structures_manager = StructuresManager(self.tile_map, resources_manager)
+        self.renderer = ChunkRenderer(resources_manager, self.tile_size)
+        self.surfaces = ChunkSurfacesCache()
 
-    def set_block_type(self, position: tuple[int, int], block_type: int) -> None:
-        self.blocks_manager.set_block_type(position, block_type)
+        self.lock = Lock()
+        self.slots = [ None ] * len(self.get_view_chunk_positions())
+        self.pending = set(self.get_view_chunk_positions())
 
-    def set_structure_type(self, position: tuple[int, int], structure_type: int) -> None:
-        self.structures_manager.set_structure_type(position, structure_type)
+    def get_view_chunk_positions(self) -> list[Position]:
+        wx, wy = self.position
 
-    def get_render_chunks(self) -> list[Chunk]:
+        return [
+            (x + wx, y + wy)
+            for x in range(self.size[0] // CHUNK_SIZE)
+            for y in range(self.size[1] // CHUNK_SIZE)
+        ]
+
+    def is_view_chunk_position(self, position: Position) -> bool:
+        x, y = position
         wx, wy = self.position
-        chunks = []
-        world_chunks = self.controller.model.data.chunks
 
-        for x in range(6):
-            cx = x + wx
+        return (
+            0 <= x - wx < self.size[0] // CHUNK_SIZE and 
+            0 <= y - wy < self.size[1] // CHUNK_SIZE
+        )
 
-            for y in range(4):
-                position = cx, y + wy
+    def get_slot_index(self, position: Position) -> int:
+        width, height = self.size[0] // CHUNK_SIZE, self.size[1] // CHUNK_SIZE
 
-                if position in world_chunks:
-                    chunks.append(world_chunks[position])
-                else:
-                    start_thread(self.controller.net_load_chunk, position)
+        return position[1] % height * width + position[0] % width
+
+    def get_chunk_neighbours(self, position: Position) -> tuple[Optional[Chunk], ...]:
+        x, y = position
+        chunks = self.controller.model.data.chunks
+
+        return (
+            chunks.get((x - 1, y)),
+            chunks.get((x, y - 1)),
+            chunks.get((x + 1, y)),
+            chunks.get((x, y + 1)),
+            chunks.get((x - 1, y + 1))
+        )
 
-        return chunks
+    def get_chunk_dependents(self, position: Position) -> list[Position]:
+        x, y = position
 
-    def render_chunks(self, chunks: list[Chunk]) -> None:
-        wx, wy = self.position
-        
-        for chunk in chunks:
-            cx, cy = chunk.position
-            cx -= wx
-            cy -= wy
+        return [
+            (x, y), (x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1), (x + 1, y - 1)
+        ]
 
-            if cx >= self.tile_map.size[0] // CHUNK_SIZE or cy >= self.tile_map.size[1] // CHUNK_SIZE:
-                continue
+    def get_chunk_surface(self, chunk: Chunk, render: bool = True) -> Optional[Surface]:
+        neighbours = self.get_chunk_neighbours(chunk.position)
+        revisions = (chunk.revision, ) + tuple(
+            None if neighbour is None else neighbour.revision for neighbour in neighbours
+        )
+        chunk_surface = self.surfaces.get(chunk.position)
+
+        if chunk_surface is not None and chunk_surface.revisions == revisions:
+            return chunk_surface.surface
 
-            for y, row in enumerate(chunk.blocks.data):
-                ty = cy * CHUNK_SIZE + y
-                
-                for x, block_type in enumerate(row):
-                    tx = cx * CHUNK_SIZE + x
+        edges = self.renderer.get_edges(neighbours)
 
-                    if block_type != 0:
-                        self.set_block_type((tx, ty), block_type)
+        if (
+            chunk_surface is not None and 
+            chunk_surface.revisions[0] == chunk.revision and 
+            chunk_surface.edges == edges
+        ):
+            chunk_surface.revisions = revisions
 
-            for y, row in enumerate(chunk.structures.data):
-                ty = cy * CHUNK_SIZE + y
-                
-                for x, structure_type in enumerate(row):
-                    tx = cx * CHUNK_SIZE + x
+            return chunk_surface.surface
 
-                    if structure_type != 0:
-                        self.set_structure_type((tx, ty), structure_type)
+        if not render:
+            return None
+
+        surface = self.renderer.render(
+            chunk, neighbours, None if chunk_surface is None else chunk_surface.surface
+        )
+        self.surfaces.set(chunk.position, ChunkSurface(revisions, edges, surface))
+
+        return surface
+
+    def invalidate(self, position: Position) -> None:
+        with self.lock:
+            for dependent in self.get_chunk_dependents(position):
+                if self.is_view_chunk_position(dependent):
+                    self.pending.add(dependent)
 
     def offset(self, offset: tuple[int, int]) -> None:
-        self.position = offset
-        self.tile_map.position = Vector2(offset) * CHUNK_SIZE * self.tile_map.renderer.tile_size
+        with self.lock:
+            previous_positions = set(self.get_view_chunk_positions())
+            self.position = offset
+
+            for position in self.get_view_chunk_positions():
+                if position not in previous_positions:
+                    self.slots[self.get_slot_index(position)] = None
+                    self.pending.add(position)
+
+            self.pending.intersection_update(self.get_view_chunk_positions())
+
+        self.controller.net_subscribe_view()
+
+    def update(self, max_renders: Optional[int] = CHUNK_RENDERS_PER_FRAME) -> None:
+        chunks = self.controller.model.data.chunks
+        width, height = self.size[0] // CHUNK_SIZE, self.size[1] // CHUNK_SIZE
+        cx, cy = self.position[0] + width / 2, self.position[1] + height / 2
+        renders = 0
+
+        with self.lock:
+            pending = sorted(
+                self.pending, 
+                key=lambda position: abs(position[0] + 0.5 - cx) + abs(position[1] + 0.5 - cy)
+            )
+            self.pending.clear()
 
-        chunks = self.get_render_chunks()
+        for position in pending:
+            chunk = chunks.get(position)
+            surface = None
 
-        self.tile_map.data.clear()
-        self.blocks_manager.blocks = Layer.filled(0, size=self.tile_map.size)
-        self.structures_manager.structures = Layer.filled(0, size=self.tile_map.size)
+            if chunk is not None:
+                surface = self.get_chunk_surface(chunk, False)
 
-        self.render_chunks(chunks)
+                if surface is None:
+                    if max_renders is not None and renders >= max_renders:
+                        with self.lock:
+                            self.pending.add(position)
+
+                        continue
+
+                    surface = self.get_chunk_surface(chunk)
+                    renders += 1
+
+            with self.lock:
+                if self.is_view_chunk_position(position):
+                    self.slots[self.get_slot_index(position)] = surface
 
     def draw(self, camera: Camera) -> None:
-        self.tile_map.draw(camera)
+        chunk_size = CHUNK_SIZE * self.tile_size
+
+        self.update()
+
+        for position in self.get_view_chunk_positions():
+            surface = self.slots[self.get_slot_index(position)]
+
+            if surface is not None:
+                camera.blit(surface, Vector2(position) * chunk_size)
 
 
 class WorldController:
@@ -394,35 +725,28 @@ class WorldController:
 
     def load_chunks(self, chunks: list[Chunk]) -> None:
         self.model.data.load_chunks(chunks)
-        self.view.render_chunks(chunks)
+
+        for chunk in chunks:
+            self.view.invalidate(chunk.position)
 
     def get_structure_type(self, position: Position) -> int:
         return self.model.get_structure_type(position)
 
     def set_block_type(self, position: Position, block_type: int) -> None:
-        self.view.set_block_type(position, block_type)
         self.model.set_block_type(position, block_type)
+        self.view.invalidate(Chunk.get_chunk_position(position))
 
     def set_structure_type(self, position: Position, structure_type: int) -> None:
-        x, y = position
-        vx, vy = self.view.position
-        rx, ry = x - vx * CHUNK_SIZE, y - vy * CHUNK_SIZE
-
-        w, h = self.view.tile_map.size
-
-        if 0 <= rx < w and 0 <= ry < h:
-            self.view.set_structure_type((rx, ry), structure_type)
-        
         self.model.set_structure_type(position, structure_type)
+        self.view.invalidate(Chunk.get_chunk_position(position))
 
-    def net_load_chunk(self, position: Position) -> None:
-        chunk = self.net_manager.load_chunk(position)
+    def net_subscribe_view(self) -> None:
+        x, y = self.view.position
+        width, height = self.view.size
 
-        if chunk is None:
-            return
-
-        with self.net_manager.client.lock:
-            self.load_chunks([chunk])
+        self.net_manager.subscribe_view(
+            (x - 1, y - 1), (width // CHUNK_SIZE + 2, height // CHUNK_SIZE + 2)
+        )
 
     def net_destroy_structure(self, position: Position) -> None:
         self.net_manager.destroy_structure(position)
@@ -435,75 +759,92 @@ class WorldController:
 
 
 class WorldGenerationManager:
+    seed: int
     controller: WorldController
 
-    def __init__(self, controller: WorldController) -> None:
+    def __init__(self, controller: WorldController, seed: int = 0) -> None:
+        self.seed = seed
         self.controller = controller
 
-    def count_neighbours(self, blocks: list[list[int]], position: tuple[int, int]) -> int:
-        x, y = position
-        count = 0
-        
-        for dx, dy in DIRECTIONS8:
-            nx, ny = x + dx, y + dy
-            
-            if nx < 0 or ny < 0 or nx >= len(blocks[0]) or ny >= len(blocks):
-                continue
-                
-            count += blocks[ny][nx]
-        
-        return count
+    def hash_cells(self, xs: np.ndarray, ys: np.ndarray, stream: int) -> np.ndarray:
+        base = (self.seed * HASH_SEED + stream * HASH_STREAM) & HASH_MASK
 
-    def generate_chunks(self, size: tuple[int, int]) -> None:
-        blocks = [
-            [
-                1 if random.random() < 0.5 else 0 
-                for _ in range(size[0] * CHUNK_SIZE)
-            ] 
-            for _ in range(size[1] * CHUNK_SIZE)
-        ]
-        structures = [[0] * size[0] * CHUNK_SIZE for _ in range(size[1] * CHUNK_SIZE)]
-
-        for _ in range(4):
-            new_blocks = deepcopy(blocks)
-            
-            for y in range(len(blocks)):
-                for x in range(len(blocks[0])):
-                    count = self.count_neighbours(blocks, (x, y))
-                
-                    if blocks[y][x]:
-                        new_blocks[y][x] = int(count >= 4)
-                    else:
-                        new_blocks[y][x] = int(count >= 5)
-                
-            blocks = new_blocks
-
-        for y, row in enumerate(blocks):
-            for x, block in enumerate(row):
-                if not block:
-                    continue
-                
-                if random.random() > 0.25:
-                    continue
+        cells = (
+            np.uint64(base)
+            + xs.astype(np.int64).astype(np.uint64)[None, :] * np.uint64(HASH_X)
+            + ys.astype(np.int64).astype(np.uint64)[:, None] * np.uint64(HASH_Y)
+        )
+        cells ^= cells >> np.uint64(30)
+        cells *= np.uint64(0xBF58476D1CE4E5B9)
+        cells ^= cells >> np.uint64(27)
+        cells *= np.uint64(0x94D049BB133111EB)
+        cells ^= cells >> np.uint64(31)
 
-                structures[y][x] = random.randint(1, 9)
+        return cells
 
-        chunks = [
-            Chunk(Layer.filled(0), (x, y), Layer.filled(1))
-            for x in range(size[0])
-            for y in range(size[1])
-        ]
+    def smooth(self, blocks: np.ndarray) -> np.ndarray:
+        height, width = blocks.shape
 
-        for chunk in chunks:
-            cx, cy = chunk.position
+        for _ in range(SMOOTHING_PASSES):
+            padded = np.pad(blocks, 1)
+            count = np.zeros(blocks.shape, np.uint8)
+
+            for dx, dy in DIRECTIONS8:
+                count += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+            blocks = np.where(blocks, count >= 4, count >= 5).astype(np.uint8)
+
+        return blocks
+
+    def generate_band(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        margin = np.arange(1, GENERATION_MARGIN + 1)
+        noise_xs = np.concatenate((xs[0] - margin[::-1], xs, xs[-1] + margin))
+        noise_ys = np.concatenate((ys[0] - margin[::-1], ys, ys[-1] + margin))
+
+        blocks = self.smooth((self.hash_cells(noise_xs, noise_ys, 0) < 1 << 63).astype(np.uint8))
+        blocks = blocks[GENERATION_MARGIN:-GENERATION_MARGIN, GENERATION_MARGIN:-GENERATION_MARGIN]
+
+        placed = blocks.astype(bool) & (self.hash_cells(xs, ys, 1) < 1 << 62)
+        structure_types = self.hash_cells(xs, ys, 2) % np.uint64(9) + np.uint64(1)
+
+        return blocks, np.where(placed, structure_types, 0).astype(np.uint8)
 
-            for x in range(CHUNK_SIZE):
-                bx = cx * CHUNK_SIZE + x
+    def generate_region(self, position: Position, size: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+        xs = np.arange(position[0] * CHUNK_SIZE, (position[0] + size[0]) * CHUNK_SIZE)
+        ys = np.arange(position[1] * CHUNK_SIZE, (position[1] + size[1]) * CHUNK_SIZE)
 
-                for y in range(CHUNK_SIZE):
-                    by = cy * CHUNK_SIZE + y
+        blocks = np.empty((len(ys), len(xs)), np.uint8)
+        structures = np.empty((len(ys), len(xs)), np.uint8)
 
-                    chunk.blocks[x, y] = blocks[by][bx]
-                    chunk.structures[x, y] = structures[by][bx]
+        for y in range(0, len(ys), GENERATION_BAND_SIZE):
+            band = slice(y, y + GENERATION_BAND_SIZE)
+            blocks[band], structures[band] = self.generate_band(xs, ys[band])
+
+        return blocks, structures
+
+    def get_region_chunks(self, 
+        position: Position, 
+        blocks: np.ndarray, 
+        structures: np.ndarray
+    ) -> list[Chunk]:
+        height, width = blocks.shape
+
+        return [
+            Chunk(
+                Layer(blocks[y:y + CHUNK_SIZE, x:x + CHUNK_SIZE]),
+                (position[0] + x // CHUNK_SIZE, position[1] + y // CHUNK_SIZE),
+                Layer(structures[y:y + CHUNK_SIZE, x:x + CHUNK_SIZE])
+            )
+            for x in range(0, width, CHUNK_SIZE)
+            for y in range(0, height, CHUNK_SIZE)
+        ]
+
+    def generate_chunk(self, position: Position) -> Chunk:
+        blocks, structures = self.generate_region(position, (1, 1))
+
+        return self.get_region_chunks(position, blocks, structures)[0]
+
+    def generate_chunks(self, size: tuple[int, int]) -> None:
+        blocks, structures = self.generate_region((0, 0), size)
 
-        self.controller.load_chunks(chunks)
+        self.controller.load_chunks(self.get_region_chunks((0, 0), blocks, structures))